@@ -0,0 +1,304 @@
+"""
+Bulk import of customers and visits for Trinix Gaming Shop
+
+Reads a CSV or Excel (.xlsx) file in chunks, normalizes phone numbers,
+skips rows that are already registered and adds everything else with one
+ID reservation and a single commit.
+
+Usage:
+    python bulk_import.py customers signups.xlsx
+    python bulk_import.py visits branch_visits.csv --data-dir data
+
+Close the application first (unless the shop runs in shared mode, see
+INSTALLATION.md) so it does not overwrite the imported rows.
+"""
+import os
+import sys
+import argparse
+import warnings
+from datetime import datetime, date, time
+import pandas as pd
+from customer_index import normalize_phone
+from database_manager import DatabaseManager
+from sqlite_manager import SQLiteDatabaseManager
+
+# Rows read per chunk
+CHUNK_SIZE = 5000
+
+# Header spellings seen on sign-up sheets and exports -> our column names
+COLUMN_ALIASES = {
+    'customer_name': 'name',
+    'full_name': 'name',
+    'phone_number': 'phone',
+    'mobile': 'phone',
+    'age': 'age_group',
+    'customer': 'customer_id',
+    'amount': 'payment_amount',
+    'snacks': 'snacks_amount',
+    'friends': 'referrals',
+}
+
+
+def _cell_text(value):
+    """Text of an Excel cell, with dates and times in the CSV formats"""
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        if value.time() == time(0, 0):
+            return value.strftime('%Y-%m-%d')
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    if isinstance(value, time):
+        return value.strftime('%H:%M:%S')
+    return str(value)
+
+
+def _read_excel_chunks(path, chunk_size):
+    """Yield the first sheet of a workbook as text dataframes, row by row"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError("Reading .xlsx files needs openpyxl (pip install openpyxl)")
+
+    # read_only streams the rows instead of loading the whole workbook
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [_cell_text(cell) for cell in header]
+
+        batch = []
+        for row in rows:
+            if row is None or all(cell is None for cell in row):
+                continue
+            batch.append([_cell_text(cell) for cell in row])
+            if len(batch) >= chunk_size:
+                yield pd.DataFrame(batch, columns=columns)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=columns)
+    finally:
+        workbook.close()
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield a CSV or Excel file as dataframes of text columns
+
+    Args:
+        path: .csv or .xlsx file
+        chunk_size: Rows per dataframe
+    """
+    if os.path.splitext(path)[1].lower() in ('.xlsx', '.xlsm'):
+        yield from _read_excel_chunks(path, chunk_size)
+        return
+
+    for chunk in pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunk_size):
+        yield chunk
+
+
+def _normalize_columns(chunk):
+    """Lower-case headers with underscores, mapped to our column names"""
+    columns = []
+    for column in chunk.columns:
+        column = str(column).strip().lower().replace(' ', '_')
+        columns.append(COLUMN_ALIASES.get(column, column))
+    chunk.columns = columns
+    return chunk
+
+
+def _parse_dates(text, dayfirst):
+    """Parse date text in any spelling pandas knows (NaT where it can't)"""
+    with warnings.catch_warnings():
+        # pandas warns on every row whose day comes first when dayfirst is off
+        warnings.simplefilter('ignore', UserWarning)
+        stamp = pd.to_datetime(text, errors='coerce', dayfirst=dayfirst)
+        # The format is guessed from the first row, so rows spelled
+        # differently are parsed one at a time
+        failed = stamp.isna() & (text != '')
+        if failed.any():
+            stamp[failed] = text[failed].map(lambda value: pd.to_datetime(value, errors='coerce', dayfirst=dayfirst))
+    return stamp
+
+
+def import_customers(db_manager, path, chunk_size=CHUNK_SIZE, progress=None):
+    """Import customers from a CSV or Excel file
+
+    Rows without a name or a valid 10-digit phone are skipped, as are
+    phones already registered or seen earlier in the file.
+
+    Args:
+        db_manager: DatabaseManager (or SQLiteDatabaseManager) to add to
+        path: File with at least 'name' and 'phone' columns
+        chunk_size: Rows read at a time
+        progress: Optional callable receiving the summary dict after each chunk
+
+    Returns:
+        Summary dict with rows, added, duplicates and invalid counts
+    """
+    summary = {'rows': 0, 'added': 0, 'duplicates': 0, 'invalid': 0}
+    seen_phones = set()
+    new_customers = []
+
+    for chunk in read_chunks(path, chunk_size):
+        chunk = _normalize_columns(chunk)
+        if 'name' not in chunk.columns or 'phone' not in chunk.columns:
+            raise ValueError(f"{path} needs 'name' and 'phone' columns")
+        summary['rows'] += len(chunk)
+
+        chunk = chunk.assign(name=chunk['name'].str.strip(),
+                             phone=chunk['phone'].map(normalize_phone))
+        valid = (chunk['name'] != '') & (chunk['phone'].str.len() == 10)
+        summary['invalid'] += int((~valid).sum())
+        chunk = chunk[valid]
+
+        # Already registered, earlier in the file, or twice in this chunk
+        registered = db_manager.customer_ids_by_phone(chunk['phone'])
+        duplicate = (chunk['phone'].isin(registered) | chunk['phone'].isin(seen_phones) |
+                     chunk['phone'].duplicated())
+        summary['duplicates'] += int(duplicate.sum())
+        chunk = chunk[~duplicate]
+        seen_phones.update(chunk['phone'])
+        new_customers.append(chunk)
+
+        if progress is not None:
+            progress(dict(summary))
+
+    if new_customers:
+        # Single ID reservation and commit for the whole file
+        summary['added'] = len(db_manager.add_customers_bulk(pd.concat(new_customers, ignore_index=True)))
+    return summary
+
+
+def import_visits(db_manager, path, chunk_size=CHUNK_SIZE, progress=None, dayfirst=True):
+    """Import visits from a CSV or Excel file
+
+    Each row names its customer by 'phone' (preferred, since another
+    branch numbers its customers differently) or by 'customer_id'. Rows
+    for unknown customers or without a date are skipped, as are visits
+    with the same customer, date and time as one already stored.
+
+    Args:
+        db_manager: DatabaseManager (or SQLiteDatabaseManager) to add to
+        path: File in the visits.csv layout
+        chunk_size: Rows read at a time
+        progress: Optional callable receiving the summary dict after each chunk
+        dayfirst: Read an ambiguous date such as 03/04/2025 as 3 April (the
+            local way of writing dates) rather than March 4; dates written
+            year first are always read as year-month-day
+
+    Returns:
+        Summary dict with rows, added, duplicates, unknown_customer and
+        invalid counts
+    """
+    summary = {'rows': 0, 'added': 0, 'duplicates': 0, 'unknown_customer': 0, 'invalid': 0}
+    seen_keys = set()
+    new_visits = []
+
+    for chunk in read_chunks(path, chunk_size):
+        chunk = _normalize_columns(chunk)
+        if 'phone' not in chunk.columns and 'customer_id' not in chunk.columns:
+            raise ValueError(f"{path} needs a 'phone' or 'customer_id' column")
+        if 'date' not in chunk.columns:
+            raise ValueError(f"{path} needs a 'date' column")
+        summary['rows'] += len(chunk)
+
+        # Parse the usual layout fast; other spellings (or a date cell that
+        # holds the time as well) fall back to the slower parser
+        dates = chunk['date'].str.strip()
+        times = chunk['time'].str.strip() if 'time' in chunk.columns else pd.Series('', index=chunk.index)
+        has_time = times != ''
+        stamp = pd.to_datetime(dates + ' ' + times.where(has_time, '00:00:00'),
+                               format='%Y-%m-%d %H:%M:%S', errors='coerce')
+        # Only add a time that was given - the date cell may hold one itself
+        text = dates.where(~has_time, dates + ' ' + times)
+        failed = stamp.isna() & (dates != '')
+        year_first = dates.str.match(r'\d{4}-')
+        # dayfirst would also swap the month and day of 2025-03-04
+        for rows, first in ((failed & year_first, False), (failed & ~year_first, dayfirst)):
+            if rows.any():
+                stamp[rows] = _parse_dates(text[rows], first)
+        valid = stamp.notna()
+        summary['invalid'] += int((~valid).sum())
+        chunk = chunk[valid].assign(date=stamp[valid].dt.strftime('%Y-%m-%d'),
+                                    time=stamp[valid].dt.strftime('%H:%M:%S'))
+
+        # Resolve customers by phone, falling back to the ID column
+        if 'phone' in chunk.columns:
+            ids = db_manager.customer_ids_by_phone(chunk['phone'])
+            customer_ids = chunk['phone'].map(normalize_phone).map(ids)
+            if 'customer_id' in chunk.columns:
+                customer_ids = customer_ids.fillna(pd.to_numeric(chunk['customer_id'], errors='coerce'))
+        else:
+            customer_ids = pd.to_numeric(chunk['customer_id'], errors='coerce')
+        known = customer_ids.isin(db_manager.customers_df['id'])
+        summary['unknown_customer'] += int((~known).sum())
+        chunk = chunk[known].assign(customer_id=customer_ids[known].astype('int64'))
+        chunk = chunk.drop(columns=['phone'], errors='ignore')
+
+        # Same customer at the same second is the same visit
+        keys = list(zip(chunk['customer_id'], chunk['date'], chunk['time']))
+        if keys:
+            stored = db_manager.get_visits_by_date_range(chunk['date'].min(), chunk['date'].max())
+            stored_keys = set(zip(stored['customer_id'].astype('int64'), stored['date'], stored['time']))
+            duplicate = []
+            for key in keys:
+                duplicate.append(key in stored_keys or key in seen_keys)
+                seen_keys.add(key)
+            duplicate = pd.Series(duplicate, index=chunk.index)
+            summary['duplicates'] += int(duplicate.sum())
+            chunk = chunk[~duplicate]
+        new_visits.append(chunk)
+
+        if progress is not None:
+            progress(dict(summary))
+
+    if new_visits:
+        # Single ID reservation and commit for the whole file
+        summary['added'] = len(db_manager.add_visits_bulk(pd.concat(new_visits, ignore_index=True)))
+    return summary
+
+
+def open_database(data_dir):
+    """Open the data folder the way the application does"""
+    shared_data = os.environ.get('TRINIX_SHARED_DATA', '').strip().lower()
+    if shared_data:
+        journal_mode = 'DELETE' if shared_data == 'network' else 'WAL'
+        return SQLiteDatabaseManager(data_dir, journal_mode=journal_mode)
+    return DatabaseManager(data_dir, journal_visits=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import customers or visits from a CSV or Excel file")
+    parser.add_argument('kind', choices=['customers', 'visits'], help="What the file contains")
+    parser.add_argument('path', help="CSV or .xlsx file to import")
+    parser.add_argument('--data-dir', default='data', help="Data folder (default: data)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Rows read at a time")
+    parser.add_argument('--monthfirst', action='store_true',
+                        help="Read visit dates like 03/04/2025 as March 4 (default: 3 April)")
+    args = parser.parse_args(argv)
+
+    def show_progress(summary):
+        print(f"  read {summary['rows']} rows...")
+
+    db_manager = open_database(args.data_dir)
+    try:
+        if args.kind == 'customers':
+            summary = import_customers(db_manager, args.path, args.chunk_size, show_progress)
+        else:
+            summary = import_visits(db_manager, args.path, args.chunk_size, show_progress,
+                                    dayfirst=not args.monthfirst)
+    except Exception as e:
+        print(f"Error importing {args.path}: {e}")
+        return 1
+    finally:
+        db_manager.close()
+
+    print(", ".join(f"{key.replace('_', ' ')}: {value}" for key, value in summary.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
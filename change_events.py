@@ -0,0 +1,93 @@
+import threading
+
+# Event kinds
+CUSTOMER_ADDED = 'customer_added'
+CUSTOMER_UPDATED = 'customer_updated'
+CUSTOMER_DELETED = 'customer_deleted'
+VISIT_ADDED = 'visit_added'
+
+EVENT_KINDS = (CUSTOMER_ADDED, CUSTOMER_UPDATED, CUSTOMER_DELETED, VISIT_ADDED)
+
+
+class ChangeEvent:
+    """
+    One change to the data, published once it is applied in memory
+
+    Attributes:
+        kind: One of EVENT_KINDS
+        row_id: Customer ID or visit ID
+        row: The full row after the change (as a dict in the CSV layout),
+            or the removed row for CUSTOMER_DELETED
+        changes: Changed columns for CUSTOMER_UPDATED, else None
+        remote: True if the change was made on another terminal
+    """
+
+    __slots__ = ('kind', 'row_id', 'row', 'changes', 'remote')
+
+    def __init__(self, kind, row_id, row, changes=None, remote=False):
+        self.kind = kind
+        self.row_id = row_id
+        self.row = row
+        self.changes = changes
+        self.remote = remote
+
+    def __repr__(self):
+        origin = " remote" if self.remote else ""
+        return f"<ChangeEvent {self.kind} {self.row_id}{origin}>"
+
+
+class ChangeFeed:
+    """
+    Publishes change events to subscribers
+    Subscribers are called synchronously, in the thread that made the
+    change, after the database manager has released its lock; an error in
+    one subscriber is printed and does not stop the others.
+    """
+
+    def __init__(self):
+        """Initialize with no subscribers"""
+        self._lock = threading.Lock()
+        # (callback, kinds or None for all)
+        self._subscribers = []
+
+    def subscribe(self, callback, kinds=None):
+        """Call `callback(event)` for every event of the given kinds
+
+        Args:
+            callback: Callable taking a ChangeEvent
+            kinds: Event kinds to receive, or None for all of them
+
+        Returns:
+            The callback, for unsubscribe()
+        """
+        with self._lock:
+            self._subscribers.append((callback, frozenset(kinds) if kinds is not None else None))
+        return callback
+
+    def unsubscribe(self, callback):
+        """Stop sending events to a callback"""
+        with self._lock:
+            self._subscribers = [(subscriber, kinds) for subscriber, kinds in self._subscribers
+                                 if subscriber is not callback]
+
+    def publish(self, events):
+        """Send events to their subscribers, in order
+
+        Args:
+            events: A ChangeEvent or a list of them
+        """
+        if isinstance(events, ChangeEvent):
+            events = [events]
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+
+        for event in events:
+            for callback, kinds in subscribers:
+                if kinds is not None and event.kind not in kinds:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Error in change subscriber for {event!r}: {e}")
@@ -0,0 +1,174 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+
+class ColumnSnapshot:
+    """
+    Binary column store for a typed dataframe
+    Every column is saved as its own .npy file and memory-mapped on load,
+    so startup skips CSV parsing and the per-column cleanups. The manifest
+    records the size and modification time of the CSV the snapshot was
+    taken from; if the CSV has changed since, the snapshot is stale and
+    the caller falls back to the CSV.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory):
+        """Initialize the snapshot stored in the given directory"""
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, self.MANIFEST)
+
+    @staticmethod
+    def source_stamp(source_path):
+        """Size and modification time identifying a version of a file
+
+        Returns:
+            A [size, mtime_ns] list, or None if the file does not exist
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _read_manifest(self):
+        """Read the manifest, or None if there is no usable snapshot"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, source_path):
+        """Check whether the snapshot still matches the source CSV"""
+        manifest = self._read_manifest()
+        if manifest is None:
+            return False
+        stamp = self.source_stamp(source_path)
+        return stamp is not None and manifest.get('source') == stamp
+
+    def load(self, source_path):
+        """Load the snapshot if it is fresh
+
+        Numeric and datetime columns are memory-mapped copy-on-write, so
+        pages are only read when touched and edits stay private to this
+        process. Text columns are converted back to Python strings.
+
+        Args:
+            source_path: The CSV the snapshot must match
+
+        Returns:
+            The typed dataframe, or None if the snapshot is missing or stale
+        """
+        manifest = self._read_manifest()
+        if manifest is None or manifest.get('source') != self.source_stamp(source_path):
+            return None
+
+        try:
+            data = {}
+            for column in manifest['columns']:
+                values = np.load(os.path.join(self.directory, column['file']), mmap_mode='c')
+                if len(values) != manifest['rows']:
+                    print(f"Snapshot column {column['name']} has the wrong length, ignoring snapshot")
+                    return None
+
+                kind = column['kind']
+                if kind == 'category':
+                    data[column['name']] = pd.Categorical.from_codes(values, categories=column['categories'])
+                elif kind == 'datetime':
+                    data[column['name']] = values.view(column['dtype'])
+                elif kind == 'text':
+                    # Plain object column, the same as a CSV load produces
+                    data[column['name']] = pd.Series(values.tolist(), dtype=object)
+                else:
+                    data[column['name']] = values
+
+            # copy=False keeps the memory-mapped arrays instead of copying them
+            return pd.DataFrame(data, columns=[column['name'] for column in manifest['columns']], copy=False)
+        except Exception as e:
+            print(f"Error loading snapshot from {self.directory}: {e}")
+            return None
+
+    def write(self, df, source_path):
+        """Write a snapshot of a typed dataframe taken from source_path
+
+        Column files are written under a new generation number and the
+        manifest is replaced last, so a crash mid-write leaves the previous
+        snapshot (or none) in place, never a mix of the two.
+
+        Args:
+            df: Dataframe to store, already cast to its schema
+            source_path: The CSV that holds the same rows
+        """
+        stamp = self.source_stamp(source_path)
+        if stamp is None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        previous = self._read_manifest()
+        generation = previous.get('generation', 0) + 1 if previous else 1
+
+        columns = []
+        for position, name in enumerate(df.columns):
+            series = df[name]
+            column = {'name': name, 'file': f"{position}.{generation}.npy"}
+
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                column['kind'] = 'category'
+                column['categories'] = [str(value) for value in series.cat.categories]
+                values = series.cat.codes.to_numpy()
+            elif pd.api.types.is_datetime64_dtype(series.dtype):
+                column['kind'] = 'datetime'
+                column['dtype'] = str(series.dtype)
+                values = series.to_numpy().view('int64')
+            elif pd.api.types.is_numeric_dtype(series.dtype):
+                column['kind'] = 'numeric'
+                values = series.to_numpy()
+            else:
+                # Fixed-width unicode keeps the file loadable without pickle
+                column['kind'] = 'text'
+                values = np.array(series.fillna('').astype(str).tolist(), dtype=str)
+                if values.size == 0:
+                    values = np.array([], dtype='<U1')
+
+            np.save(os.path.join(self.directory, column['file']), values)
+            columns.append(column)
+
+        manifest = {
+            'generation': generation,
+            'source': stamp,
+            'rows': len(df),
+            'columns': columns
+        }
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+
+        self._remove_old_files({column['file'] for column in columns})
+
+    def _remove_old_files(self, keep):
+        """Delete column files from earlier generations"""
+        for name in os.listdir(self.directory):
+            if name.endswith('.npy') and name not in keep:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    # Still memory-mapped on Windows - removed on a later write
+                    pass
+
+    def remove(self):
+        """Delete the snapshot, leaving any subdirectories alone"""
+        if not os.path.isdir(self.directory):
+            return
+        self._remove_old_files(set())
+        for name in (self.MANIFEST, self.MANIFEST + ".tmp"):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
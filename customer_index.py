@@ -0,0 +1,460 @@
+from bisect import bisect_left
+import numpy as np
+
+
+def normalize_phone(phone):
+    """
+    Convert a phone number to the canonical 10-digit form (e.g. 0712345678)
+
+    Handles the formats that end up in the data files: numbers that lost
+    their leading zero or were read back as floats ('712345678.0') and the
+    +254 international prefix. Anything else is returned as digits only.
+    """
+    if phone is None:
+        return ''
+
+    text = str(phone).strip()
+    if text.lower() == 'nan':
+        return ''
+
+    # Phone numbers parsed as floats by read_csv
+    if text.endswith('.0'):
+        text = text[:-2]
+
+    digits = ''.join(c for c in text if c.isdigit())
+
+    if len(digits) == 12 and digits.startswith('254'):
+        # +254 712 345 678 -> 0712345678
+        digits = '0' + digits[3:]
+    elif len(digits) == 9:
+        # Leading zero dropped
+        digits = '0' + digits
+
+    return digits
+
+
+class PhoneIndex:
+    """
+    In-memory phone number index for customer lookups
+
+    - exact: hash of canonical phone -> customer IDs
+    - prefix: sorted array of phones searched with bisect
+    - partial digits: trigram -> customer IDs, verified against the phone
+
+    Phones passed in must already be canonical (see normalize_phone).
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._exact = {}
+        self._phone_of = {}
+        self._sorted_phones = []
+        self._sorted_ids = []
+        # Bulk-built trigram postings: gram -> rows of the _bulk_* arrays,
+        # ordered by customer ID
+        self._bulk_ids = np.empty(0, dtype=np.int64)
+        self._bulk_numbers = np.empty(0, dtype=np.int64)
+        self._bulk_phones = []
+        self._grams = {}
+        # Trigram postings for phones added since the last build
+        self._gram_delta = {}
+
+    def build(self, pairs):
+        """Rebuild the index from (customer_id, phone) pairs"""
+        self.__init__()
+
+        entries = []
+        for customer_id, phone in pairs:
+            if customer_id is None or not phone:
+                continue
+            phone = str(phone)
+            self._phone_of[customer_id] = phone
+            self._exact.setdefault(phone, []).append(customer_id)
+            entries.append((phone, customer_id))
+
+        # One sort instead of repeated inserts
+        entries.sort()
+        self._sorted_phones = [phone for phone, _ in entries]
+        self._sorted_ids = [customer_id for _, customer_id in entries]
+
+        self._build_grams()
+
+    def _build_grams(self):
+        """Build the trigram postings for all 10-digit phones in one pass"""
+        ten_digit = [(customer_id, phone) for customer_id, phone in self._phone_of.items()
+                     if len(phone) == 10 and phone.isdigit()]
+
+        if ten_digit:
+            self._bulk_ids = np.array([customer_id for customer_id, _ in ten_digit], dtype=np.int64)
+            self._bulk_phones = [phone for _, phone in ten_digit]
+            text = ''.join(self._bulk_phones).encode('ascii')
+            digits = (np.frombuffer(text, dtype=np.uint8).reshape(-1, 10) - ord('0')).astype(np.int64)
+            self._bulk_numbers = digits @ (10 ** np.arange(9, -1, -1, dtype=np.int64))
+
+            # Trigram code at each of the 8 offsets: d[i]*100 + d[i+1]*10 + d[i+2]
+            codes = (digits[:, :-2] * 100 + digits[:, 1:-1] * 10 + digits[:, 2:]).ravel()
+            rows = np.repeat(np.arange(len(ten_digit)), 10 - self.GRAM_SIZE + 1)
+
+            # Group by code, customer ID ascending within each posting
+            order = np.lexsort((self._bulk_ids[rows], codes))
+            codes = codes[order]
+            rows = rows[order]
+            bounds = np.searchsorted(codes, np.arange(1001))
+            for code in np.unique(codes):
+                posting = rows[bounds[code]:bounds[code + 1]]
+                # A gram repeated within one phone only needs one entry
+                keep = np.ones(len(posting), dtype=bool)
+                keep[1:] = posting[1:] != posting[:-1]
+                self._grams[f"{code:03d}"] = posting[keep]
+
+        # Anything that is not a plain 10-digit number goes in the delta lists
+        for customer_id, phone in self._phone_of.items():
+            if not (len(phone) == 10 and phone.isdigit()):
+                self._add_grams(customer_id, phone)
+
+    def _add_grams(self, customer_id, phone):
+        """Add a phone's trigrams to the incremental postings"""
+        for gram in set(self._iter_grams(phone)):
+            self._gram_delta.setdefault(gram, []).append(customer_id)
+
+    def add(self, customer_id, phone):
+        """Add a customer's phone to the index"""
+        if not phone:
+            return
+        phone = str(phone)
+
+        self._phone_of[customer_id] = phone
+        self._exact.setdefault(phone, []).append(customer_id)
+        self._add_grams(customer_id, phone)
+
+        position = bisect_left(self._sorted_phones, phone)
+        # Keep (phone, id) order so equal phones stay sorted by ID
+        while (position < len(self._sorted_phones) and self._sorted_phones[position] == phone
+               and self._sorted_ids[position] < customer_id):
+            position += 1
+        self._sorted_phones.insert(position, phone)
+        self._sorted_ids.insert(position, customer_id)
+
+    def remove(self, customer_id):
+        """Remove a customer from the index
+
+        Trigram postings are left as they are; stale entries are filtered
+        out when candidates are checked against the current phone.
+        """
+        phone = self._phone_of.pop(customer_id, None)
+        if phone is None:
+            return
+
+        ids = self._exact.get(phone, [])
+        if customer_id in ids:
+            ids.remove(customer_id)
+        if not ids:
+            self._exact.pop(phone, None)
+
+        position = bisect_left(self._sorted_phones, phone)
+        while position < len(self._sorted_phones) and self._sorted_phones[position] == phone:
+            if self._sorted_ids[position] == customer_id:
+                del self._sorted_phones[position]
+                del self._sorted_ids[position]
+                break
+            position += 1
+
+    def lookup(self, phone):
+        """Customer IDs with exactly this phone number"""
+        return list(self._exact.get(normalize_phone(phone), []))
+
+    def prefix(self, prefix, limit=20):
+        """Customer IDs whose phone starts with the given digits"""
+        digits = ''.join(c for c in str(prefix) if c.isdigit())
+        if not digits:
+            return []
+
+        start = bisect_left(self._sorted_phones, digits)
+        # ':' sorts right after '9', so this is the end of the prefix range
+        end = bisect_left(self._sorted_phones, digits + ':', lo=start)
+        return self._sorted_ids[start:min(end, start + limit)]
+
+    def contains(self, digits, limit=20):
+        """Customer IDs whose phone contains the digits anywhere"""
+        digits = ''.join(c for c in str(digits) if c.isdigit())
+        if not digits:
+            return []
+
+        if len(digits) < self.GRAM_SIZE:
+            # Too short for the trigram index; short digit strings match
+            # often, so a scan that stops at the limit is quick
+            matches = []
+            for customer_id, phone in self._phone_of.items():
+                if digits in phone:
+                    matches.append(customer_id)
+                    if len(matches) >= limit:
+                        break
+            return sorted(matches)
+
+        grams = set(self._iter_grams(digits))
+        matches = []
+
+        # Bulk postings: take the rarest gram and check its rows in one
+        # vectorized pass (a 3-digit query is the gram itself)
+        rarest = min(grams, key=lambda gram: len(self._grams.get(gram, ())))
+        rows = self._grams.get(rarest)
+        if rows is not None and len(rows):
+            if len(digits) > self.GRAM_SIZE:
+                rows = rows[self._rows_containing(rows, digits)]
+            # Convert in small chunks so a common gram stops at the limit early
+            for start in range(0, len(rows), 256):
+                chunk = rows[start:start + 256]
+                for row, customer_id in zip(chunk.tolist(), self._bulk_ids[chunk].tolist()):
+                    # Skip rows whose customer was removed or changed phone
+                    if self._phone_of.get(customer_id) == self._bulk_phones[row]:
+                        matches.append(customer_id)
+                        if len(matches) >= limit:
+                            break
+                if len(matches) >= limit:
+                    break
+
+        # Phones added since the build
+        delta = min((self._gram_delta.get(gram, []) for gram in grams), key=len)
+        seen = set(matches)
+        for customer_id in delta:
+            if customer_id not in seen and digits in self._phone_of.get(customer_id, ''):
+                seen.add(customer_id)
+                matches.append(customer_id)
+
+        matches.sort()
+        return matches[:limit]
+
+    def _rows_containing(self, rows, digits):
+        """Mask of bulk rows whose 10-digit number contains the digits"""
+        numbers = self._bulk_numbers[rows]
+        length = len(digits)
+        target = int(digits)
+        mask = np.zeros(len(rows), dtype=bool)
+        for offset in range(10 - length + 1):
+            mask |= (numbers // 10 ** (10 - offset - length)) % 10 ** length == target
+        return mask
+
+    def _iter_grams(self, digits):
+        """All overlapping digit trigrams of a phone number"""
+        for i in range(len(digits) - self.GRAM_SIZE + 1):
+            yield digits[i:i + self.GRAM_SIZE]
+
+
+def normalize_name(name):
+    """Lowercase a name and collapse runs of whitespace for matching"""
+    if name is None:
+        return ''
+    text = str(name)
+    if text.lower() == 'nan':
+        return ''
+    return ' '.join(text.lower().split())
+
+
+class NameIndex:
+    """
+    Trigram inverted index over customer names
+
+    Names are padded ('  john doe ') so trigrams also mark word starts.
+    Trigrams are packed into integers (three 21-bit code points); the bulk
+    postings are built with numpy and later adds go to incremental lists.
+    """
+
+    # Candidates re-ranked in Python per requested result
+    RERANK_FACTOR = 10
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._name_of = {}
+        self._bulk_ids = np.empty(0, dtype=np.int64)
+        self._bulk_names = []
+        self._bulk_gram_counts = np.empty(0, dtype=np.int64)
+        self._grams = {}
+        self._gram_delta = {}
+
+    @staticmethod
+    def _gram_code(gram):
+        """Pack a three character gram into one integer"""
+        return (ord(gram[0]) << 42) | (ord(gram[1]) << 21) | ord(gram[2])
+
+    @classmethod
+    def _name_grams(cls, name):
+        """Distinct trigram codes of an already-normalized name"""
+        padded = '  ' + name + ' '
+        return {cls._gram_code(padded[i:i + 3]) for i in range(len(padded) - 2)}
+
+    @classmethod
+    def _query_grams(cls, query):
+        """Trigram codes of a search query
+
+        Only the front is padded - the user may still be typing the word
+        """
+        padded = '  ' + query
+        return {cls._gram_code(padded[i:i + 3]) for i in range(len(padded) - 2)}
+
+    def build(self, pairs):
+        """Rebuild the index from (customer_id, name) pairs"""
+        self.__init__()
+
+        for customer_id, name in pairs:
+            name = normalize_name(name)
+            if customer_id is None or not name:
+                continue
+            self._name_of[customer_id] = name
+
+        if not self._name_of:
+            return
+
+        self._bulk_ids = np.array(list(self._name_of.keys()), dtype=np.int64)
+        self._bulk_names = list(self._name_of.values())
+
+        # Fixed-width UTF-32 array -> one code point per column
+        padded = ['  ' + name + ' ' for name in self._bulk_names]
+        lengths = np.array([len(p) for p in padded], dtype=np.int64)
+        width = int(lengths.max())
+        points = np.array(padded, dtype=f'U{width}').view(np.uint32).reshape(-1, width).astype(np.uint64)
+
+        codes = (points[:, :-2] << np.uint64(42)) | (points[:, 1:-1] << np.uint64(21)) | points[:, 2:]
+        valid = np.arange(width - 2) < (lengths - 2)[:, None]
+        rows = np.broadcast_to(np.arange(len(padded))[:, None], codes.shape)[valid]
+        codes = codes[valid]
+
+        # Group by gram, drop grams repeated within one name
+        order = np.lexsort((rows, codes))
+        codes = codes[order]
+        rows = rows[order]
+        keep = np.ones(len(codes), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+        codes = codes[keep]
+        rows = rows[keep]
+
+        self._bulk_gram_counts = np.bincount(rows, minlength=len(padded))
+        unique_codes, starts = np.unique(codes, return_index=True)
+        ends = np.append(starts[1:], len(codes))
+        for code, start, end in zip(unique_codes.tolist(), starts.tolist(), ends.tolist()):
+            self._grams[code] = rows[start:end]
+
+    def add(self, customer_id, name):
+        """Add a customer's name to the index"""
+        name = normalize_name(name)
+        if not name:
+            return
+
+        self._name_of[customer_id] = name
+        for code in self._name_grams(name):
+            self._gram_delta.setdefault(code, []).append(customer_id)
+
+    def remove(self, customer_id):
+        """Remove a customer from the index
+
+        Postings are left in place; stale entries are skipped because the
+        customer's current name no longer matches the indexed one.
+        """
+        self._name_of.pop(customer_id, None)
+
+    def search(self, query, limit=10, min_score=0.5, fuzzy=True):
+        """Rank customers by how well their name matches the query
+
+        Exact matches come first, then names starting with the query, then
+        names containing it, then fuzzy trigram matches.
+
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of results
+            min_score: Minimum share of the query's trigrams a fuzzy match
+                must contain
+            fuzzy: Include fuzzy matches; pass False when the result picks
+                a customer rather than filling a suggestion list
+
+        Returns:
+            A list of customer IDs, best match first
+        """
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        query_grams = self._query_grams(query)
+        candidates = {}
+
+        # Bulk postings: count shared grams per row in one bincount
+        postings = [self._grams[code] for code in query_grams if code in self._grams]
+        if postings:
+            counts = np.bincount(np.concatenate(postings), minlength=len(self._bulk_ids))
+            rows = np.nonzero(counts)[0]
+            shared = counts[rows]
+            coverage = shared / len(query_grams)
+            similarity = shared / (len(query_grams) + self._bulk_gram_counts[rows] - shared)
+
+            # Keep the best rows by trigram score before the exact checks
+            keep = max(limit * self.RERANK_FACTOR, 200)
+            if len(rows) > keep:
+                best = np.lexsort((-similarity, -coverage))[:keep]
+                rows, coverage, similarity = rows[best], coverage[best], similarity[best]
+
+            for row, cov, sim in zip(rows.tolist(), coverage.tolist(), similarity.tolist()):
+                customer_id = int(self._bulk_ids[row])
+                if self._name_of.get(customer_id) == self._bulk_names[row]:
+                    candidates[customer_id] = (cov, sim)
+
+        # Names added since the build
+        delta_counts = {}
+        for code in query_grams:
+            for customer_id in self._gram_delta.get(code, ()):
+                delta_counts[customer_id] = delta_counts.get(customer_id, 0) + 1
+        for customer_id, count in delta_counts.items():
+            name = self._name_of.get(customer_id)
+            if name is None or self._name_grams(name).isdisjoint(query_grams):
+                # Removed, or renamed to something unrelated
+                continue
+            count = len(self._name_grams(name) & query_grams)
+            candidates[customer_id] = (count / len(query_grams),
+                                       count / (len(query_grams) + len(self._name_grams(name)) - count))
+
+        ranked = []
+        for customer_id, (cov, sim) in candidates.items():
+            name = self._name_of[customer_id]
+            if name == query:
+                boost = 3
+            elif name.startswith(query):
+                boost = 2
+            elif query in name:
+                boost = 1
+            elif fuzzy and cov >= min_score:
+                boost = 0
+            else:
+                continue
+            ranked.append((-boost, -cov, -sim, len(name), customer_id))
+
+        ranked.sort()
+        return [entry[-1] for entry in ranked[:limit]]
+
+    def containing(self, text):
+        """All customer IDs whose name contains the text (case-insensitive)"""
+        text = normalize_name(text)
+        if not text:
+            return sorted(self._name_of.keys())
+
+        if len(text) < 3:
+            # No full trigram to look up
+            return sorted(customer_id for customer_id, name in self._name_of.items() if text in name)
+
+        # Every inner trigram of the text must be in the name
+        text_grams = {self._gram_code(text[i:i + 3]) for i in range(len(text) - 2)}
+        matches = set()
+
+        postings = [self._grams.get(code) for code in text_grams]
+        if all(posting is not None for posting in postings):
+            counts = np.bincount(np.concatenate(postings), minlength=len(self._bulk_ids))
+            for row in np.nonzero(counts == len(text_grams))[0].tolist():
+                customer_id = int(self._bulk_ids[row])
+                name = self._name_of.get(customer_id)
+                if name == self._bulk_names[row] and text in name:
+                    matches.add(customer_id)
+
+        rarest = min((self._gram_delta.get(code, []) for code in text_grams), key=len)
+        for customer_id in rarest:
+            if text in self._name_of.get(customer_id, ''):
+                matches.add(customer_id)
+
+        return sorted(matches)
@@ -0,0 +1,114 @@
+import pandas as pd
+from daily_aggregates import as_amount
+
+
+def empty_stats():
+    """Stats of a customer without visits"""
+    return {
+        'visits': 0,
+        'first_visit': None,
+        'last_visit': None,
+        'total_spent': 0.0,
+        'total_points': 0
+    }
+
+
+def _earliest(a, b):
+    """Earlier of two visit times, either of which may be None"""
+    return b if a is None or (b is not None and b < a) else a
+
+
+def _latest(a, b):
+    """Later of two visit times, either of which may be None"""
+    return b if a is None or (b is not None and b > a) else a
+
+
+class CustomerStats:
+    """
+    Rolling per-customer visit statistics
+    Holds, for every customer with visits, the visit count, first and last
+    visit time, total spend (gaming + snacks) and total points. The table is
+    built once with a vectorized pass over the visits and from then on
+    add() updates one customer per check-in, so profile and frequency
+    lookups no longer scan the visits.
+    """
+
+    def __init__(self):
+        """Initialize an empty (not yet built) table"""
+        # customer_id -> stats dict; None until build() runs
+        self._stats = None
+
+    @property
+    def is_built(self):
+        """Whether the table has been built from the visits"""
+        return self._stats is not None
+
+    @staticmethod
+    def _aggregate(visits):
+        """Per-customer stats of typed visits, computed in one groupby"""
+        if visits.empty:
+            return {}
+        spent = visits['payment_amount'].astype('float64') + visits['snacks_amount'].astype('float64')
+        grouped = visits.assign(spent=spent, points=visits['points'].astype('int64')).groupby('customer_id').agg(
+            visits=('visit_id', 'count'),
+            first_visit=('visited_at', 'min'),
+            last_visit=('visited_at', 'max'),
+            total_spent=('spent', 'sum'),
+            total_points=('points', 'sum')
+        )
+        stats = {}
+        for customer_id, row in zip(grouped.index, grouped.itertuples(index=False)):
+            stats[int(customer_id)] = {
+                'visits': int(row.visits),
+                'first_visit': None if pd.isna(row.first_visit) else row.first_visit,
+                'last_visit': None if pd.isna(row.last_visit) else row.last_visit,
+                'total_spent': float(row.total_spent),
+                'total_points': int(row.total_points)
+            }
+        return stats
+
+    def build(self, visits):
+        """Rebuild the whole table from typed visits"""
+        self._stats = self._aggregate(visits)
+
+    def build_from(self, frames):
+        """Rebuild the whole table from typed visits given in batches"""
+        self._stats = {}
+        for visits in frames:
+            self.add_frame(visits)
+
+    def invalidate(self):
+        """Drop the table; it is rebuilt on next use"""
+        self._stats = None
+
+    def add(self, customer_id, visited_at, payment_amount, snacks_amount, points):
+        """Count one new visit (ignored until the table is built)"""
+        if self._stats is None:
+            return
+        visited_at = pd.Timestamp(visited_at)
+        stats = self._stats.setdefault(int(customer_id), empty_stats())
+        stats['visits'] += 1
+        stats['first_visit'] = _earliest(stats['first_visit'], visited_at)
+        stats['last_visit'] = _latest(stats['last_visit'], visited_at)
+        stats['total_spent'] += as_amount(payment_amount) + as_amount(snacks_amount)
+        stats['total_points'] += int(points)
+
+    def add_frame(self, visits):
+        """Fold a batch of typed visits into the table (e.g. a journal replay)"""
+        if self._stats is None:
+            return
+        for customer_id, new in self._aggregate(visits).items():
+            stats = self._stats.get(customer_id)
+            if stats is None:
+                self._stats[customer_id] = new
+                continue
+            stats['visits'] += new['visits']
+            stats['first_visit'] = _earliest(stats['first_visit'], new['first_visit'])
+            stats['last_visit'] = _latest(stats['last_visit'], new['last_visit'])
+            stats['total_spent'] += new['total_spent']
+            stats['total_points'] += new['total_points']
+
+    def get(self, customer_id):
+        """Stats of one customer (a copy; zeros if they have no visits)"""
+        stats = self._stats.get(int(customer_id)) if self._stats is not None else None
+        return dict(stats) if stats is not None else empty_stats()
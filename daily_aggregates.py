@@ -0,0 +1,132 @@
+import numpy as np
+
+
+def empty_day():
+    """Totals of a day without visits"""
+    return {
+        'gaming': 0.0,
+        'snacks': 0.0,
+        'visits': 0,
+        'customers': set(),
+        'payment_methods': {},
+        'consoles': {},
+        'game_genres': {}
+    }
+
+
+def as_amount(value):
+    """Convert an amount the way the float32 visit columns store it"""
+    try:
+        amount = float(np.float32(value))
+    except (ValueError, TypeError):
+        return 0.0
+    return 0.0 if np.isnan(amount) else amount
+
+
+class DailyAggregates:
+    """
+    Per-day sales totals, kept up to date as visits are added
+    Days are grouped by month like the visit partitions: a month is
+    aggregated from its visits the first time it is asked for, and from
+    then on add() keeps it current at O(1) per visit. Reports over a date
+    range then cost one dictionary per day instead of a pass over visits.
+    """
+
+    def __init__(self):
+        """Initialize with no months aggregated"""
+        # month -> {'YYYY-MM-DD' -> day totals}
+        self._months = {}
+
+    def has_month(self, month):
+        """Check whether a month has been aggregated"""
+        return month in self._months
+
+    def build_month(self, month, visits):
+        """Aggregate one month from its typed visits
+
+        Args:
+            month: Partition key ('YYYY-MM')
+            visits: Typed visits of that month
+        """
+        days = {}
+        if len(visits):
+            day_keys = visits['visited_at'].dt.strftime('%Y-%m-%d')
+            # Accumulate the float32 amount columns in float64
+            visits = visits.assign(payment_amount=visits['payment_amount'].astype('float64'),
+                                   snacks_amount=visits['snacks_amount'].astype('float64'))
+
+            totals = visits.groupby(day_keys).agg(
+                gaming=('payment_amount', 'sum'),
+                snacks=('snacks_amount', 'sum'),
+                visits=('visit_id', 'count')
+            )
+            for day, row in totals.iterrows():
+                totals_of_day = empty_day()
+                totals_of_day['gaming'] = float(row['gaming'])
+                totals_of_day['snacks'] = float(row['snacks'])
+                totals_of_day['visits'] = int(row['visits'])
+                days[day] = totals_of_day
+
+            for day, customer_ids in visits.groupby(day_keys)['customer_id'].unique().items():
+                days[day]['customers'] = set(int(customer_id) for customer_id in customer_ids)
+
+            payments = visits.groupby([day_keys, 'payment_method'], observed=True)['payment_amount'].agg(['sum', 'count'])
+            for (day, method), row in payments.iterrows():
+                days[day]['payment_methods'][method] = {'amount': float(row['sum']), 'count': int(row['count'])}
+
+            for column in ('console', 'game_genre'):
+                counts = visits.groupby([day_keys, column], observed=True).size()
+                key = 'consoles' if column == 'console' else 'game_genres'
+                for (day, value), count in counts.items():
+                    days[day][key][value] = int(count)
+
+        self._months[month] = days
+
+    def invalidate(self, month=None):
+        """Forget a month's totals (all months if None); rebuilt on next use"""
+        if month is None:
+            self._months = {}
+        else:
+            self._months.pop(month, None)
+
+    def add(self, day, customer_id, game_genre, console, payment_method, payment_amount, snacks_amount):
+        """Count one new visit
+
+        Months that were never aggregated are skipped - they include the
+        visit when they are built from the visits later
+        """
+        days = self._months.get(day[:7])
+        if days is None:
+            return
+
+        gaming = as_amount(payment_amount)
+        totals = days.setdefault(day, empty_day())
+        totals['gaming'] += gaming
+        totals['snacks'] += as_amount(snacks_amount)
+        totals['visits'] += 1
+        totals['customers'].add(int(customer_id))
+
+        method = totals['payment_methods'].setdefault(str(payment_method), {'amount': 0.0, 'count': 0})
+        method['amount'] += gaming
+        method['count'] += 1
+        totals['consoles'][str(console)] = totals['consoles'].get(str(console), 0) + 1
+        totals['game_genres'][str(game_genre)] = totals['game_genres'].get(str(game_genre), 0) + 1
+
+    def days(self, months, start_day, end_day):
+        """Totals of every day with visits in [start_day, end_day]
+
+        Args:
+            months: Aggregated months overlapping the range
+            start_day: First day ('YYYY-MM-DD')
+            end_day: Last day ('YYYY-MM-DD')
+
+        Returns:
+            A list of (day, totals) tuples in date order
+        """
+        result = []
+        for month in sorted(months):
+            for day, totals in self._months.get(month, {}).items():
+                if start_day <= day <= end_day:
+                    result.append((day, totals))
+        result.sort(key=lambda item: item[0])
+        return result
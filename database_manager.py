@@ -1,443 +1,1727 @@
-import os
-import pandas as pd
-import json
-from datetime import datetime
-
-class DatabaseManager:
-    """
-    Simple database manager for Trinix Gaming Shop
-    Uses CSV files to store customer and visit data
-    """
-    
-    def __init__(self, data_dir="data"):
-        """Initialize the database manager"""
-        self.data_dir = data_dir
-        self.customers_file = os.path.join(data_dir, "customers.csv")
-        self.visits_file = os.path.join(data_dir, "visits.csv")
-        
-        # Create data directory if it doesn't exist
-        os.makedirs(data_dir, exist_ok=True)
-        
-        # Initialize dataframes
-        self.customers_df = self._load_customers()
-        self.visits_df = self._load_visits()
-    
-    def _load_customers(self):
-        """Load customers from CSV file or create empty dataframe"""
-        if os.path.exists(self.customers_file):
-            # Load the dataframe
-            df = pd.read_csv(self.customers_file)
-            
-            # Ensure ID column is integer
-            if 'id' in df.columns:
-                # First convert to float to handle any potential NaN values
-                df['id'] = pd.to_numeric(df['id'], errors='coerce')
-                # Then convert to integer, filling NaN with -1
-                df['id'] = df['id'].fillna(-1).astype(int)
-                
-                # Print debug info
-                print(f"Loaded {len(df)} customers with ID types: {df['id'].dtype}")
-            
-            # Ensure all text columns are stored as strings
-            text_columns = ['name', 'phone', 'age_group', 'location', 'occupation', 
-                           'qr_code_path', 'registration_date']
-            
-            for col in text_columns:
-                if col in df.columns:
-                    df[col] = df[col].astype(str)
-                    # Replace 'nan' strings with empty strings
-                    df[col] = df[col].replace('nan', '')
-            
-            return df
-        else:
-            return pd.DataFrame(columns=[
-                'id', 'name', 'phone', 'age_group', 'location', 'occupation', 
-                'qr_code_path', 'registration_date'
-            ])
-    
-    def _load_visits(self):
-        """Load visits from CSV file or create empty dataframe"""
-        if os.path.exists(self.visits_file):
-            df = pd.read_csv(self.visits_file)
-            # Add snacks_details column if it doesn't exist
-            if 'snacks_details' not in df.columns:
-                df['snacks_details'] = ""
-            # Add points column if it doesn't exist
-            if 'points' not in df.columns:
-                # Calculate points based on payment amount
-                df['points'] = df['payment_amount'].apply(self._calculate_points)
-            return df
-        else:
-            return pd.DataFrame(columns=[
-                'visit_id', 'customer_id', 'date', 'time', 'game_genre', 
-                'console', 'payment_method', 'payment_amount', 
-                'snacks_amount', 'snacks_details', 'referrals', 'points'
-            ])
-            
-    def _calculate_points(self, payment_amount):
-        """Calculate points based on payment amount"""
-        try:
-            # Convert payment_amount to float to ensure proper comparison
-            amount = float(payment_amount)
-            if amount <= 50:
-                return 3
-            elif amount <= 70:
-                return 5
-            elif amount <= 100:
-                return 8
-            elif amount <= 170:
-                return 10
-            elif amount <= 200:
-                return 15
-            else:
-                return 20
-        except (ValueError, TypeError):
-            # If conversion fails, return default points
-            print(f"Warning: Could not convert payment amount '{payment_amount}' to float. Using default points.")
-            return 3
-    
-    def save_customers(self, df=None):
-        """Save customers to CSV file
-        
-        Args:
-            df: Optional dataframe to save. If None, saves self.customers_df
-        """
-        if df is not None:
-            # Update the internal dataframe
-            self.customers_df = df
-        
-        # Save to file
-        self.customers_df.to_csv(self.customers_file, index=False)
-    
-    def save_visits(self):
-        """Save visits to CSV file"""
-        self.visits_df.to_csv(self.visits_file, index=False)
-    
-    def add_customer(self, name, phone, age_group, location, occupation, qr_code_path):
-        """Add a new customer to the database"""
-        # Find the next available ID
-        if len(self.customers_df) > 0:
-            # Get the maximum ID and add 1
-            try:
-                max_id = self.customers_df['id'].max()
-                # Ensure it's an integer
-                if pd.isna(max_id):
-                    customer_id = 1
-                else:
-                    customer_id = int(max_id) + 1
-            except Exception as e:
-                print(f"Error determining next customer ID: {e}")
-                # Fallback to length + 1
-                customer_id = len(self.customers_df) + 1
-        else:
-            customer_id = 1
-        
-        # Ensure customer_id is an integer
-        customer_id = int(customer_id)
-        
-        print(f"Adding new customer with ID: {customer_id}, type: {type(customer_id)}")
-        
-        new_customer = {
-            'id': customer_id,
-            'name': str(name),
-            'phone': str(phone),  # Ensure phone is stored as string
-            'age_group': str(age_group),
-            'location': str(location),
-            'occupation': str(occupation),
-            'qr_code_path': str(qr_code_path),
-            'registration_date': datetime.now().strftime('%Y-%m-%d')
-        }
-        
-        self.customers_df = pd.concat([self.customers_df, pd.DataFrame([new_customer])], ignore_index=True)
-        
-        # Ensure ID column is integer type after concat
-        self.customers_df['id'] = self.customers_df['id'].astype(int)
-        
-        self.save_customers()
-        
-        return customer_id
-    
-    def update_customer(self, customer_id, **kwargs):
-        """Update customer details"""
-        try:
-            # Try to convert to integer for consistent comparison
-            customer_id_int = int(customer_id)
-            customer_idx = self.customers_df[self.customers_df['id'] == customer_id_int].index
-            
-            if len(customer_idx) == 0:
-                # If not found, try string comparison
-                customer_id_str = str(customer_id)
-                customer_idx = self.customers_df[self.customers_df['id'].astype(str) == customer_id_str].index
-            
-            if len(customer_idx) == 0:
-                print(f"Customer with ID {customer_id} not found for update")
-                return False
-            
-            for key, value in kwargs.items():
-                if key in self.customers_df.columns:
-                    # Ensure text values are stored as strings
-                    if key in ['name', 'phone', 'age_group', 'location', 'occupation', 'qr_code_path']:
-                        self.customers_df.at[customer_idx[0], key] = str(value)
-                    else:
-                        self.customers_df.at[customer_idx[0], key] = value
-            
-            self.save_customers()
-            return True
-        except Exception as e:
-            print(f"Error updating customer with ID {customer_id}: {e}")
-            return False
-    
-    def delete_customer(self, customer_id):
-        """Delete a customer from the database"""
-        try:
-            # Try to convert to integer for consistent comparison
-            customer_id_int = int(customer_id)
-            customer_idx = self.customers_df[self.customers_df['id'] == customer_id_int].index
-            
-            if len(customer_idx) == 0:
-                # If not found, try string comparison
-                customer_id_str = str(customer_id)
-                customer_idx = self.customers_df[self.customers_df['id'].astype(str) == customer_id_str].index
-            
-            if len(customer_idx) == 0:
-                print(f"Customer with ID {customer_id} not found for deletion")
-                return False
-            
-            self.customers_df = self.customers_df.drop(customer_idx)
-            self.save_customers()
-            return True
-        except Exception as e:
-            print(f"Error deleting customer with ID {customer_id}: {e}")
-            return False
-    
-    def get_customer(self, customer_id):
-        """Get customer details by ID"""
-        try:
-            # Try to convert to integer for consistent comparison
-            customer_id_int = int(customer_id)
-            customer = self.customers_df[self.customers_df['id'] == customer_id_int]
-            
-            if customer.empty:
-                # If not found, try string comparison
-                customer_id_str = str(customer_id)
-                customer = self.customers_df[self.customers_df['id'].astype(str) == customer_id_str]
-            
-            if customer.empty:
-                print(f"Customer with ID {customer_id} not found")
-                return None
-            
-            return customer.iloc[0].to_dict()
-        except Exception as e:
-            print(f"Error getting customer with ID {customer_id}: {e}")
-            # Try as string
-            try:
-                customer_id_str = str(customer_id)
-                customer = self.customers_df[self.customers_df['id'].astype(str) == customer_id_str]
-                
-                if not customer.empty:
-                    return customer.iloc[0].to_dict()
-            except Exception as inner_e:
-                print(f"Error in string fallback: {inner_e}")
-            
-            return None
-    
-    def add_visit(self, customer_id, game_genre, console, payment_method, 
-                 payment_amount, snacks_amount, referrals, snacks_details=""):
-        """
-        Add a new visit to the database
-        
-        Note: The 'referrals' parameter is now used to store the 'friends_number' value
-        but the database column name remains 'referrals' for backward compatibility
-        """
-        visit_id = len(self.visits_df) + 1
-        
-        # Calculate points based on payment amount
-        points = self._calculate_points(payment_amount)
-        
-        new_visit = {
-            'visit_id': visit_id,
-            'customer_id': customer_id,
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'time': datetime.now().strftime('%H:%M:%S'),
-            'game_genre': game_genre,
-            'console': console,
-            'payment_method': payment_method,
-            'payment_amount': payment_amount,
-            'snacks_amount': snacks_amount,
-            'snacks_details': snacks_details,
-            'referrals': referrals,  # This stores the friends_number value
-            'points': points  # Add points based on payment amount
-        }
-        
-        self.visits_df = pd.concat([self.visits_df, pd.DataFrame([new_visit])], ignore_index=True)
-        self.save_visits()
-        
-        return visit_id
-    
-    def get_visits_by_customer(self, customer_id):
-        """Get all visits for a specific customer"""
-        visits = self.visits_df[self.visits_df['customer_id'] == customer_id]
-        
-        # Ensure points column exists
-        if 'points' not in visits.columns and not visits.empty:
-            # Calculate points based on payment amount
-            visits['points'] = visits['payment_amount'].apply(self._calculate_points)
-            
-        return visits
-    
-    def get_visits_by_date_range(self, start_date, end_date):
-        """Get all visits within a date range"""
-        # Convert date columns to string for safe comparison
-        date_col = self.visits_df['date'].astype(str)
-        
-        # Filter by date range
-        visits = self.visits_df[
-            (date_col >= start_date) & 
-            (date_col <= end_date)
-        ]
-        
-        # Ensure points column exists
-        if 'points' not in visits.columns and not visits.empty:
-            # Calculate points based on payment amount
-            visits['points'] = visits['payment_amount'].apply(self._calculate_points)
-            
-        return visits
-    
-    def get_sales_by_date_range(self, start_date, end_date):
-        """Get sales data within a date range"""
-        visits = self.get_visits_by_date_range(start_date, end_date)
-        
-        if visits.empty:
-            return {
-                'total_gaming': 0,
-                'total_snacks': 0,
-                'total_sales': 0,
-                'daily_sales': {}
-            }
-        
-        # Calculate totals
-        total_gaming = visits['payment_amount'].sum()
-        total_snacks = visits['snacks_amount'].sum()
-        total_sales = total_gaming + total_snacks
-        
-        # Group by date
-        daily_sales = visits.groupby('date').agg({
-            'payment_amount': 'sum',
-            'snacks_amount': 'sum',
-            'visit_id': 'count'
-        }).rename(columns={'visit_id': 'visit_count'})
-        
-        # Convert to dictionary
-        daily_sales_dict = {}
-        for date, row in daily_sales.iterrows():
-            daily_sales_dict[date] = {
-                'gaming': row['payment_amount'],
-                'snacks': row['snacks_amount'],
-                'total': row['payment_amount'] + row['snacks_amount'],
-                'visits': row['visit_count']
-            }
-        
-        return {
-            'total_gaming': total_gaming,
-            'total_snacks': total_snacks,
-            'total_sales': total_sales,
-            'daily_sales': daily_sales_dict
-        }
-    
-    def get_customer_visit_frequency(self, customer_id):
-        """Get visit frequency for a specific customer"""
-        visits = self.get_visits_by_customer(customer_id)
-        
-        if visits.empty:
-            return {
-                'total_visits': 0,
-                'first_visit': None,
-                'last_visit': None,
-                'frequency': 'N/A'
-            }
-        
-        # Sort visits by date
-        visits = visits.sort_values('date')
-        
-        # Calculate frequency
-        first_visit = visits.iloc[0]['date']
-        last_visit = visits.iloc[-1]['date']
-        total_visits = len(visits)
-        
-        # Convert dates to datetime objects
-        first_date = datetime.strptime(first_visit, '%Y-%m-%d')
-        last_date = datetime.strptime(last_visit, '%Y-%m-%d')
-        
-        # Calculate days between first and last visit
-        days_diff = (last_date - first_date).days
-        
-        if days_diff == 0:
-            frequency = 'First Visit'
-        elif days_diff <= 7:
-            frequency = 'Weekly'
-        elif days_diff <= 30:
-            frequency = 'Monthly'
-        else:
-            frequency = 'Occasional'
-        
-        return {
-            'total_visits': total_visits,
-            'first_visit': first_visit,
-            'last_visit': last_visit,
-            'frequency': frequency
-        }
-    
-    def get_shift_summary(self, date=None):
-        """Get summary for the current shift (or specified date)"""
-        if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
-        
-        visits = self.visits_df[self.visits_df['date'] == date]
-        
-        if visits.empty:
-            return {
-                'date': date,
-                'total_customers': 0,
-                'total_gaming': 0,
-                'total_snacks': 0,
-                'total_sales': 0,
-                'payment_methods': {},
-                'consoles': {},
-                'game_genres': {}
-            }
-        
-        # Calculate totals
-        total_customers = len(visits['customer_id'].unique())
-        total_gaming = visits['payment_amount'].sum()
-        total_snacks = visits['snacks_amount'].sum()
-        total_sales = total_gaming + total_snacks
-        
-        # Payment methods breakdown
-        payment_methods = visits.groupby('payment_method').agg({
-            'payment_amount': 'sum',
-            'visit_id': 'count'
-        }).rename(columns={'visit_id': 'count'})
-        
-        payment_methods_dict = {}
-        for method, row in payment_methods.iterrows():
-            payment_methods_dict[method] = {
-                'amount': row['payment_amount'],
-                'count': row['count']
-            }
-        
-        # Consoles breakdown
-        consoles = visits.groupby('console').size().to_dict()
-        
-        # Game genres breakdown
-        game_genres = visits.groupby('game_genre').size().to_dict()
-        
-        return {
-            'date': date,
-            'total_customers': total_customers,
-            'total_gaming': total_gaming,
-            'total_snacks': total_snacks,
-            'total_sales': total_sales,
-            'payment_methods': payment_methods_dict,
-            'consoles': consoles,
-            'game_genres': game_genres
-        }
\ No newline at end of file
+import os
+import pandas as pd
+import json
+import shutil
+import threading
+from datetime import datetime
+from visit_journal import VisitJournal
+from write_behind import GroupCommitWriter
+from id_sequences import IdSequences
+from column_snapshot import ColumnSnapshot
+from daily_aggregates import DailyAggregates
+from customer_stats import CustomerStats
+from points_engine import PointsEngine
+from change_events import (ChangeEvent, ChangeFeed, CUSTOMER_ADDED, CUSTOMER_UPDATED,
+                           CUSTOMER_DELETED, VISIT_ADDED)
+from visit_partitions import (UNDATED, VisitPartitions, concat_frames, month_key, month_keys,
+                              months_overlapping)
+from customer_index import PhoneIndex, NameIndex, normalize_phone
+from online_backup import (BACKUP_GENERATIONS, STAGING_DIR, BackupStore, backup_files,
+                           default_backup_dir, file_stamp)
+
+# Column types applied whenever data is loaded. Low-cardinality text is
+# stored as categoricals so groupbys run on integer codes.
+CUSTOMER_SCHEMA = {
+    'id': 'int32',
+    'name': 'str',
+    'phone': 'str',
+    'age_group': 'category',
+    'location': 'str',
+    'occupation': 'category',
+    'qr_code_path': 'str',
+    'registration_date': 'str'
+}
+
+# In memory the CSV 'date' and 'time' columns are a single datetime64 column
+VISIT_SCHEMA = {
+    'visit_id': 'int32',
+    'customer_id': 'int32',
+    'visited_at': 'datetime64[ns]',
+    'game_genre': 'category',
+    'console': 'category',
+    'payment_method': 'category',
+    'payment_amount': 'float32',
+    'snacks_amount': 'float32',
+    'snacks_details': 'str',
+    'referrals': 'int16',
+    'points': 'int16'
+}
+
+# Journal operations that change customers (visits use 'add_visit')
+CUSTOMER_JOURNAL_OPS = ('add_customer', 'update_customer', 'delete_customer')
+
+# Column order of visits.csv and of the frames returned to callers
+VISIT_COLUMNS = ['visit_id', 'customer_id', 'date', 'time', 'game_genre',
+                 'console', 'payment_method', 'payment_amount',
+                 'snacks_amount', 'snacks_details', 'referrals', 'points']
+
+
+def apply_schema(df, schema):
+    """Cast a dataframe to the declared column types
+    
+    Missing columns are added, unparseable numbers become -1 for ID columns
+    and 0 otherwise, and missing text becomes ''. Extra columns are kept.
+    """
+    df = df.copy()
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            df[col] = None
+        
+        if dtype.startswith('int'):
+            default = -1 if col.endswith('id') else 0
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(default).astype(dtype)
+        elif dtype.startswith('float'):
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(dtype)
+        elif dtype.startswith('datetime'):
+            df[col] = pd.to_datetime(df[col], errors='coerce').astype(dtype)
+        else:
+            text = df[col].fillna('').astype(str).replace('nan', '')
+            df[col] = text.astype('category') if dtype == 'category' else text.astype(object)
+    
+    extra = [col for col in df.columns if col not in schema]
+    return df[list(schema) + extra]
+
+
+def append_rows(df, new_rows, schema):
+    """Append rows to a typed dataframe without losing categorical dtypes
+    
+    New category values are added to the existing column (codes are kept),
+    so the concat stays categorical instead of falling back to object.
+    """
+    new_rows = apply_schema(new_rows, schema)
+    for col, dtype in schema.items():
+        if dtype == 'category':
+            missing = new_rows[col].cat.categories.difference(df[col].cat.categories)
+            if len(missing):
+                df[col] = df[col].cat.add_categories(missing)
+            new_rows[col] = new_rows[col].cat.set_categories(df[col].cat.categories)
+    
+    if df.empty:
+        return new_rows.reset_index(drop=True)
+    return pd.concat([df, new_rows], ignore_index=True)
+
+
+def write_csv_atomic(df, path):
+    """Write a dataframe to CSV so a crash never leaves a truncated file
+    
+    The rows go to a temporary file that is fsync'd and then renamed over
+    the target, so readers see either the old file or the new one
+    """
+    tmp_path = path + ".tmp"
+    df.to_csv(tmp_path, index=False)
+    with open(tmp_path, 'rb+') as f:
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    
+    # Make the rename itself durable (not possible on Windows)
+    if hasattr(os, 'O_DIRECTORY'):
+        try:
+            dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+
+def visits_with_date_columns(visits):
+    """Convert typed visits back to the CSV layout with 'date' and 'time' text"""
+    out = visits.drop(columns=['visited_at'])
+    out.insert(2, 'date', visits['visited_at'].dt.strftime('%Y-%m-%d').fillna(''))
+    out.insert(3, 'time', visits['visited_at'].dt.strftime('%H:%M:%S').fillna(''))
+    return out
+
+
+class DatabaseManager:
+    """
+    Simple database manager for Trinix Gaming Shop
+    Uses CSV files to store customer and visit data; visits are stored as
+    one file per month in data/visits (e.g. data/visits/2026-10.csv)
+    """
+    
+    # New visits are buffered and folded into their month in chunks of this size
+    VISIT_CHUNK_SIZE = 256
+    
+    # Seconds a backup waits for queued writes before it is skipped
+    BACKUP_FLUSH_TIMEOUT = 30
+    
+    def __init__(self, data_dir="data", journal_visits=False,
+                 compact_threshold=500, compact_interval=60, use_snapshots=True,
+                 write_behind=False, flush_interval=0.25, points_engine=None,
+                 resident_months=None):
+        """Initialize the database manager
+        
+        Args:
+            data_dir: Directory holding the data files
+            journal_visits: If True, every change is first appended as one
+                fsync'd record to visits.journal (a write-ahead log) instead of
+                rewriting customers.csv or the month's visit file. A background
+                thread folds the log into the CSV files, and any records left
+                after a crash are replayed on the next start
+            compact_threshold: Journal records that trigger an early compaction
+            compact_interval: Seconds between background compaction passes
+            use_snapshots: If True, load from the binary snapshots in
+                data/snapshot when they match the CSV files, and refresh them
+                after compaction and on close
+            write_behind: If True, writes are queued and committed in batches
+                by a background thread, so add/update calls return without
+                touching the disk. Every write is on disk within about
+                flush_interval seconds, and before flush() or close() return;
+                a crash or power cut in between loses it, so call flush()
+                before telling anyone a change is saved
+            flush_interval: Seconds between group commits with write_behind
+            points_engine: PointsEngine scoring visits; defaults to the tiers
+                in data/points_tiers.json, or the built-in tiers
+            resident_months: Keep only the visits of the current month and
+                the months before it, up to this many months, in memory.
+                Older months are read (from their snapshot or CSV file) when
+                a query needs them and unloaded again afterwards. None keeps
+                every month loaded once it has been read
+        """
+        self.data_dir = data_dir
+        self.customers_file = os.path.join(data_dir, "customers.csv")
+        # Single-file layout from before partitioning; migrated on first start
+        self.visits_file = os.path.join(data_dir, "visits.csv")
+        self.visits_dir = os.path.join(data_dir, "visits")
+        self.visit_catalog_file = os.path.join(self.visits_dir, "catalog.json")
+        
+        # Create data directory if it doesn't exist
+        os.makedirs(data_dir, exist_ok=True)
+        
+        # Guards the dataframes against the background compaction thread
+        self._lock = threading.RLock()
+        # Change events for the UI (see change_events.py)
+        self.events = ChangeFeed()
+        # Only one compaction writes the visit files at a time
+        self._compact_lock = threading.Lock()
+        # Only one backup runs at a time (see backup())
+        self._backup_lock = threading.Lock()
+        self._backup_thread = None
+        
+        # Visits added since the last fold, keyed by month
+        self._pending_visits = {}
+        # Months changed in memory but not yet written to their file
+        self._dirty_visit_months = set()
+        # Customer changes logged in the journal but not yet in customers.csv
+        self._customers_dirty = False
+        self._last_visit_id = 0
+        
+        # Binary snapshots of the typed dataframes - the CSVs stay the
+        # source of truth (and the export accountants open in Excel)
+        self.snapshot_dir = None
+        self.customers_snapshot = None
+        if use_snapshots:
+            self.snapshot_dir = os.path.join(data_dir, "snapshot")
+            self.customers_snapshot = ColumnSnapshot(os.path.join(self.snapshot_dir, "customers"))
+        
+        # Loyalty points tiers - needed to score visits saved without points
+        self.points = points_engine or PointsEngine.load(os.path.join(data_dir, "points_tiers.json"))
+        
+        # Journal setup - must exist before the visits are loaded
+        self.journal = None
+        if journal_visits:
+            self.journal = VisitJournal(os.path.join(data_dir, "visits.journal"))
+        self.compact_threshold = compact_threshold
+        self.compact_interval = compact_interval
+        
+        # Initialize dataframes - only the current month of visits is read now
+        customers = self._load_customers()
+        if self.journal is not None:
+            customers = self._replay_customer_journal(customers)
+        self.customers_df = customers
+        # Per-day sales totals, built per month on first use
+        self._daily = DailyAggregates()
+        self.resident_months = resident_months
+        # Per-customer visit stats, built on the first profile lookup
+        self._customer_stats = CustomerStats()
+        # With a residency window the all-months frame is not kept around
+        self._visit_partitions = VisitPartitions(self._load_visit_month,
+                                                 apply_schema(pd.DataFrame(), VISIT_SCHEMA),
+                                                 cache_combined=resident_months is None)
+        self._open_visits()
+        
+        # Persisted ID counters, moved past any ID already in the data
+        self.sequences = IdSequences(os.path.join(data_dir, "sequences.json"))
+        self._sync_sequences()
+        
+        # Start the background compaction pass
+        self._compact_wakeup = threading.Event()
+        self._stop_compactor = threading.Event()
+        self._compactor = None
+        if self.journal is not None:
+            self._compactor = threading.Thread(target=self._compaction_loop,
+                                               name="visit-journal-compactor",
+                                               daemon=True)
+            self._compactor.start()
+        
+        # Start the group-commit writer
+        self._writer = None
+        if write_behind:
+            self._writer = GroupCommitWriter(self._commit_writes, flush_interval,
+                                             name="database-writer")
+    
+    @property
+    def customers_df(self):
+        """All customers; rows are kept in a RangeIndex so labels are positions"""
+        return self._customers_df
+    
+    @customers_df.setter
+    def customers_df(self, df):
+        with self._lock:
+            self._customers_df = df.reset_index(drop=True)
+            self._rebuild_customer_index()
+            self._rebuild_search_indexes()
+    
+    def _rebuild_search_indexes(self):
+        """Rebuild the phone and name indexes from the customers dataframe"""
+        keys = self._customer_keys()
+        self._phone_index = PhoneIndex()
+        if 'phone' in self._customers_df.columns:
+            self._phone_index.build(zip(keys, self._customers_df['phone'].tolist()))
+        self._name_index = NameIndex()
+        if 'name' in self._customers_df.columns:
+            self._name_index.build(zip(keys, self._customers_df['name'].tolist()))
+    
+    def _customer_keys(self):
+        """Customer IDs as index keys (None for IDs that are not numeric)"""
+        keys = []
+        for customer_id in self._customers_df['id'].tolist():
+            try:
+                keys.append(int(customer_id))
+            except (ValueError, TypeError):
+                keys.append(None)
+        return keys
+    
+    def _rebuild_customer_index(self):
+        """Rebuild the customer id -> row position index"""
+        self._id_index = {}
+        for position, customer_key in enumerate(self._customer_keys()):
+            # Non-numeric IDs are only reachable through the string fallback
+            if customer_key is not None:
+                # Keep the first row for duplicate IDs, like the old mask lookup
+                self._id_index.setdefault(customer_key, position)
+    
+    def _unindex_customer_position(self, position, customer_key):
+        """Update the id index for a row dropped from the customers frame
+        
+        Only the rows after the dropped one move, so only their entries are
+        touched - cheap when a recently added customer is deleted
+        
+        Args:
+            position: Position the dropped row had
+            customer_key: Its ID as an index key (None if not numeric)
+        """
+        if customer_key is not None and self._id_index.get(customer_key) == position:
+            del self._id_index[customer_key]
+        for new_position, customer_id in enumerate(self._customers_df['id'].iloc[position:].tolist(), position):
+            try:
+                key = int(customer_id)
+            except (ValueError, TypeError):
+                continue
+            if self._id_index.get(key) == new_position + 1:
+                self._id_index[key] = new_position
+    
+    def _customer_position(self, customer_id):
+        """Find the row position of a customer
+        
+        Uses the id index first; the string comparison over the whole column
+        only runs when the index has no entry for the ID
+        
+        Returns:
+            The row position, or None if the customer does not exist
+        """
+        try:
+            position = self._id_index.get(int(customer_id))
+            if position is not None:
+                return position
+        except (ValueError, TypeError):
+            pass
+        
+        # Fallback for IDs stored or passed in an unexpected format
+        customer_id_str = str(customer_id).strip()
+        matches = (self._customers_df['id'].astype(str) == customer_id_str).to_numpy().nonzero()[0]
+        if len(matches) == 0:
+            return None
+        return int(matches[0])
+    
+    @property
+    def visits_df(self):
+        """All visits in the visits.csv layout, with any buffered new visits
+        folded in
+        
+        The columns are VISIT_COLUMNS with 'date' ('YYYY-MM-DD') and 'time'
+        ('HH:MM:SS') as text, like get_visits_by_date_range; the typed
+        'visited_at' column is kept internal. Reads every month from disk;
+        queries over a date range should use get_visits_by_date_range, which
+        only reads the months it needs
+        """
+        with self._lock:
+            self._fold_pending_visits()
+            visits = self._visit_partitions.combined()
+            self._trim_resident_visits()
+        return visits_with_date_columns(visits)
+    
+    @visits_df.setter
+    def visits_df(self, df):
+        # Rows in the visits.csv layout get the typed schema first
+        if 'visited_at' not in df.columns:
+            df = self._prepare_visits(df.copy())
+        with self._lock:
+            # Every old and new month has to be rewritten by save_visits
+            self._dirty_visit_months |= self._visit_partitions.months
+            self._visit_partitions.replace_all(df)
+            self._dirty_visit_months |= self._visit_partitions.months
+            self._pending_visits = {}
+            self._daily.invalidate()
+            self._customer_stats.invalidate()
+            if len(df):
+                self._last_visit_id = max(self._last_visit_id, int(df['visit_id'].max()))
+    
+    def _trim_resident_visits(self):
+        """Unload months that fall outside the residency window
+        
+        Months with changes not yet written stay loaded; they are unloaded
+        after the next save. So do months with buffered visits not folded
+        in yet, which would otherwise be lost with the unloaded frame. Call
+        with the lock held.
+        """
+        if self.resident_months is None:
+            return
+        
+        oldest = (pd.Period(datetime.now(), 'M') - max(self.resident_months - 1, 0)).strftime('%Y-%m')
+        for month in self._visit_partitions.loaded_months():
+            cold = month == UNDATED or month < oldest
+            if cold and month not in self._dirty_visit_months and month not in self._pending_visits:
+                self._visit_partitions.unload(month)
+    
+    def _iter_visit_months(self):
+        """Yield (month, visits) for every month in order
+        
+        Months outside the residency window are unloaded as soon as the
+        caller moves on, so a pass over all history holds one cold month at
+        a time. Call with the lock held.
+        """
+        self._fold_pending_visits()
+        for month in sorted(self._visit_partitions.months):
+            yield month, self._visit_partitions.frame(month)
+            self._trim_resident_visits()
+    
+    def memory_usage(self):
+        """Memory held by the loaded data
+        
+        Returns:
+            Dictionary with resident_months (the loaded months), stored_months
+            (count), visit_rows, visit_bytes, pending_visits, customer_rows
+            and customer_bytes
+        """
+        with self._lock:
+            resident = self._visit_partitions.loaded_months()
+            frames = [self._visit_partitions.frame(month) for month in resident]
+            return {
+                'resident_months': resident,
+                'stored_months': len(self._visit_partitions.months),
+                'visit_rows': sum(len(frame) for frame in frames),
+                'visit_bytes': int(sum(frame.memory_usage(deep=True).sum() for frame in frames)),
+                'pending_visits': sum(len(rows) for rows in self._pending_visits.values()),
+                'customer_rows': len(self._customers_df),
+                'customer_bytes': int(self._customers_df.memory_usage(deep=True).sum())
+            }
+    
+    def _fold_pending_visits(self, months=None):
+        """Append buffered visits to their month's dataframe in a single concat"""
+        for month in list(self._pending_visits if months is None else months):
+            rows = self._pending_visits.pop(month, None)
+            if rows:
+                frame = self._visit_partitions.frame(month)
+                self._visit_partitions.set_frame(month, append_rows(frame, pd.DataFrame(rows), VISIT_SCHEMA))
+    
+    def _load_customers(self):
+        """Load customers from the snapshot, CSV file or create empty dataframe"""
+        if self.customers_snapshot is not None:
+            df = self.customers_snapshot.load(self.customers_file)
+            if df is not None:
+                print(f"Loaded {len(df)} customers from snapshot")
+                return df
+        
+        if os.path.exists(self.customers_file):
+            # Load the dataframe - read text columns as text so phone numbers
+            # keep their leading zeros
+            df = pd.read_csv(self.customers_file, dtype={'phone': str})
+            print(f"Loaded {len(df)} customers")
+        else:
+            df = pd.DataFrame(columns=list(CUSTOMER_SCHEMA))
+        
+        return self._prepare_customers(df)
+    
+    def _prepare_customers(self, df):
+        """Apply the customer schema and canonical phone numbers"""
+        df = apply_schema(df, CUSTOMER_SCHEMA)
+        df['phone'] = df['phone'].map(normalize_phone).astype(object)
+        return df
+    
+    def _visit_month_file(self, month):
+        """Path of the CSV file holding one month of visits"""
+        return os.path.join(self.visits_dir, f"{month}.csv")
+    
+    def _visit_month_snapshot(self, month):
+        """Binary snapshot of one month of visits, or None without snapshots"""
+        if self.snapshot_dir is None:
+            return None
+        return ColumnSnapshot(os.path.join(self.snapshot_dir, "visits", month))
+    
+    def _stored_visit_months(self):
+        """Months that have a visit file on disk"""
+        if not os.path.isdir(self.visits_dir):
+            return []
+        return sorted(name[:-4] for name in os.listdir(self.visits_dir) if name.endswith('.csv'))
+    
+    def _load_visit_month(self, month):
+        """Load one month of visits from its snapshot or CSV file"""
+        month_file = self._visit_month_file(month)
+        snapshot = self._visit_month_snapshot(month)
+        if snapshot is not None:
+            df = snapshot.load(month_file)
+            if df is not None:
+                return df
+        
+        if os.path.exists(month_file):
+            df = pd.read_csv(month_file, dtype={'date': str, 'time': str})
+        else:
+            df = pd.DataFrame(columns=VISIT_COLUMNS)
+        return self._prepare_visits(df)
+    
+    def _load_visits(self):
+        """Load every visit from the CSV files into a single dataframe"""
+        months = self._stored_visit_months()
+        if months:
+            return concat_frames([self._load_visit_month(month) for month in months],
+                                 apply_schema(pd.DataFrame(), VISIT_SCHEMA))
+        
+        if os.path.exists(self.visits_file):
+            df = pd.read_csv(self.visits_file, dtype={'date': str, 'time': str})
+        else:
+            df = pd.DataFrame(columns=VISIT_COLUMNS)
+        return self._prepare_visits(df)
+    
+    def _open_visits(self):
+        """Register the stored months and load the current (hot) month
+        
+        Older months stay on disk until a query needs them
+        """
+        if not self._stored_visit_months() and os.path.exists(self.visits_file):
+            self._migrate_visits_file()
+        
+        self._visit_partitions.register(self._stored_visit_months())
+        self._visit_catalog = self._read_visit_catalog()
+        
+        current_month = datetime.now().strftime('%Y-%m')
+        if current_month in self._visit_partitions.months:
+            self._visit_partitions.frame(current_month)
+        
+        # Replay visits that were journaled but not yet compacted
+        if self.journal is not None:
+            self._replay_journal()
+        
+        self._last_visit_id = self._scan_last_visit_id()
+    
+    def _migrate_visits_file(self):
+        """Split the old single visits.csv into one file per month"""
+        # The snapshot of the old file (if still current) saves parsing it
+        legacy_snapshot = None
+        df = None
+        if self.snapshot_dir is not None:
+            legacy_snapshot = ColumnSnapshot(os.path.join(self.snapshot_dir, "visits"))
+            df = legacy_snapshot.load(self.visits_file)
+        if df is None:
+            df = self._load_visits()
+        print(f"Splitting {len(df)} visits from {self.visits_file} into monthly files")
+        
+        self._visit_catalog = {}
+        for month, part in df.groupby(month_keys(df['visited_at']), sort=True):
+            self._write_visit_month(month, part.reset_index(drop=True))
+        self._write_visit_catalog()
+        
+        # Keep the old file for reference, it is no longer read or written
+        os.replace(self.visits_file, self.visits_file + ".migrated")
+        if legacy_snapshot is not None:
+            legacy_snapshot.remove()
+    
+    def _read_visit_catalog(self):
+        """Read the per-month row counts and last visit IDs"""
+        try:
+            with open(self.visit_catalog_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_visit_catalog(self):
+        """Atomically write the per-month row counts and last visit IDs"""
+        tmp_file = self.visit_catalog_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._visit_catalog, f, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.visit_catalog_file)
+    
+    def _scan_last_visit_id(self):
+        """Highest visit ID, read from the catalog for months not in memory"""
+        last_id = 0
+        for month in self._visit_partitions.months:
+            entry = self._visit_catalog.get(month)
+            month_file = self._visit_month_file(month)
+            if (not self._visit_partitions.is_loaded(month) and entry is not None
+                    and entry.get('source') == ColumnSnapshot.source_stamp(month_file)):
+                last_id = max(last_id, entry['last_visit_id'])
+                continue
+            
+            # Catalog missing or out of date - read the month itself
+            frame = self._visit_partitions.frame(month)
+            if len(frame):
+                last_id = max(last_id, int(frame['visit_id'].max()))
+        return last_id
+    
+    def _prepare_visits(self, df):
+        """Apply the visit schema to rows in the CSV layout"""
+        # Add snacks_details column if it doesn't exist
+        if 'snacks_details' not in df.columns:
+            df['snacks_details'] = ""
+        # Add points column if it doesn't exist (scored in one vectorized pass)
+        if 'points' not in df.columns:
+            df['points'] = self.points.points_array(df['payment_amount'])
+        
+        # Combine 'date' and 'time' into one datetime64 column
+        if 'visited_at' not in df.columns:
+            date = df['date'].fillna('').astype(str)
+            time = df['time'].fillna('00:00:00').astype(str)
+            visited_at = pd.to_datetime(date + ' ' + time, format='%Y-%m-%d %H:%M:%S', errors='coerce')
+            
+            # Rows written in another format fall back to the slower parser
+            failed = visited_at.isna() & (date != '')
+            if failed.any():
+                visited_at[failed] = pd.to_datetime(date[failed] + ' ' + time[failed], errors='coerce')
+            df['visited_at'] = visited_at
+        df = df.drop(columns=[col for col in ('date', 'time') if col in df.columns])
+        
+        return apply_schema(df, VISIT_SCHEMA)
+    
+    def _replay_customer_journal(self, df):
+        """Apply logged customer changes that are not in customers.csv yet
+        
+        Only the customers named in the log are touched, so recovery time
+        depends on the length of the log, not on the number of customers.
+        Replaying a record that already reached the CSV changes nothing.
+        
+        Args:
+            df: Typed customers loaded from the snapshot or CSV
+        """
+        records = [(op, row) for op, row in self.journal.read_records() if op in CUSTOMER_JOURNAL_OPS]
+        if not records:
+            return df
+        
+        positions = {}
+        for position, customer_id in enumerate(df['id'].tolist()):
+            positions.setdefault(int(customer_id), position)
+        
+        # Final state of every logged customer (None = deleted)
+        final = {}
+        for op, row in records:
+            customer_id = int(row['id'])
+            if op == 'add_customer':
+                final[customer_id] = dict(row)
+            elif op == 'update_customer':
+                current = final.get(customer_id)
+                if customer_id not in final and customer_id in positions:
+                    current = df.iloc[positions[customer_id]].to_dict()
+                if current is not None:
+                    current.update(row)
+                    final[customer_id] = current
+            elif op == 'delete_customer':
+                final[customer_id] = None
+        
+        print(f"Replaying {len(records)} journaled customer changes")
+        df = df.copy()
+        added = []
+        for customer_id, row in final.items():
+            position = positions.get(customer_id)
+            if row is None:
+                continue
+            if position is None:
+                added.append(row)
+                continue
+            for key, value in row.items():
+                if key not in df.columns or key == 'id':
+                    continue
+                if CUSTOMER_SCHEMA.get(key) == 'category' and value not in df[key].cat.categories:
+                    df[key] = df[key].cat.add_categories([value])
+                df.at[position, key] = value
+        
+        deleted = [positions[customer_id] for customer_id, row in final.items()
+                   if row is None and customer_id in positions]
+        if deleted:
+            df = df.drop(index=df.index[deleted]).reset_index(drop=True)
+        if added:
+            df = append_rows(df, pd.DataFrame(added), CUSTOMER_SCHEMA)
+        
+        self._customers_dirty = True
+        return df
+    
+    def _replay_journal(self):
+        """Add journaled visits that are not in the visit files yet"""
+        rows = [row for op, row in self.journal.read_records() if op == 'add_visit']
+        if not rows:
+            return
+        
+        # A compaction may have written the month before it could drop the
+        # journal, and a retried batch may have been journaled twice
+        rows = pd.DataFrame(rows).drop_duplicates('visit_id', keep='last')
+        replayed = self._merge_visits(self._prepare_visits(rows))
+        with self._lock:
+            self._dirty_visit_months.update(replayed)
+            self._trim_resident_visits()
+        
+        if replayed:
+            print(f"Replaying {sum(len(part) for part in replayed.values())} journaled visits")
+    
+    def _merge_visits(self, visits):
+        """Add typed visits whose IDs are not in memory yet
+        
+        Returns:
+            Dictionary of month -> typed visits added to that month
+        """
+        added = {}
+        with self._lock:
+            for month, part in visits.groupby(month_keys(visits['visited_at']), sort=True):
+                self._fold_pending_visits([month])
+                frame = self._visit_partitions.frame(month)
+                part = part[~part['visit_id'].isin(frame['visit_id'])]
+                if len(part):
+                    self._visit_partitions.set_frame(month, append_rows(frame, part, VISIT_SCHEMA))
+                    self._last_visit_id = max(self._last_visit_id, int(part['visit_id'].max()))
+                    self._daily.invalidate(month)
+                    self._customer_stats.add_frame(part)
+                    added[month] = part
+        return added
+            
+    def recompute_points(self):
+        """Re-score every visit with the current points tiers
+        
+        Reads the months one at a time, scores each one in a single
+        vectorized pass and marks the changed months for the next
+        save_visits() (they stay in memory until then)
+        
+        Returns:
+            Number of visits whose points changed
+        """
+        changed = 0
+        with self._lock:
+            for month, frame in self._iter_visit_months():
+                points = self.points.points_array(frame['payment_amount'])
+                differs = frame['points'].to_numpy() != points
+                if differs.any():
+                    frame = frame.copy()
+                    frame['points'] = points
+                    self._visit_partitions.set_frame(month, frame)
+                    self._persist_visit_points(month, frame[differs])
+                    changed += int(differs.sum())
+            if changed:
+                self._customer_stats.invalidate()
+        return changed
+    
+    def save_customers(self, df=None):
+        """Save customers to CSV file
+        
+        Args:
+            df: Optional dataframe to save. If None, saves self.customers_df
+        """
+        if df is not None:
+            # Update the internal dataframe
+            self.customers_df = self._prepare_customers(df)
+        
+        # Copy under the lock so the writer thread never sees a half-applied edit
+        with self._lock:
+            customers = self._customers_df.copy()
+        
+        # Save to file atomically - the snapshot is refreshed on close
+        write_csv_atomic(customers, self.customers_file)
+    
+    def save_visits(self):
+        """Save changed months of visits to their CSV files"""
+        if self.journal is not None:
+            # The month files now hold everything, so the journal can be folded
+            self.compact_journal()
+            return
+        
+        self._write_dirty_visit_months()
+    
+    def compact_journal(self):
+        """Fold the journal into customers.csv and the monthly visit files
+        
+        Only the files changed since the last pass are rewritten. New
+        changes keep going to a fresh journal while the files are written,
+        and each file is replaced atomically so a crash leaves the old one
+        intact; the old journal is dropped only once every file is written
+        """
+        if self.journal is None:
+            return
+        
+        with self._compact_lock:
+            with self._lock:
+                has_records = self.journal.begin_compaction()
+                write_customers = self._customers_dirty
+                self._customers_dirty = False
+            
+            try:
+                if write_customers:
+                    self.save_customers()
+            except Exception:
+                with self._lock:
+                    self._customers_dirty = True
+                raise
+            self._write_dirty_visit_months()
+            
+            if has_records:
+                self.journal.finish_compaction()
+    
+    def _write_dirty_visit_months(self):
+        """Write every month changed since it was last saved"""
+        with self._lock:
+            months = sorted(self._dirty_visit_months)
+            self._dirty_visit_months = set()
+            self._fold_pending_visits(months)
+            frames = {month: self._visit_partitions.frame(month).copy() for month in months}
+        
+        if not frames:
+            return
+        
+        try:
+            for month, df in frames.items():
+                self._write_visit_month(month, df)
+            self._write_visit_catalog()
+        except Exception:
+            # Written again on the next pass
+            with self._lock:
+                self._dirty_visit_months.update(months)
+            raise
+        
+        # Cold months that were only held because they had changes
+        with self._lock:
+            self._trim_resident_visits()
+    
+    def _write_visit_month(self, month, df):
+        """Atomically replace one month's CSV file and refresh its snapshot
+        
+        Args:
+            month: Partition key ('YYYY-MM')
+            df: Typed visits of that month
+        """
+        os.makedirs(self.visits_dir, exist_ok=True)
+        month_file = self._visit_month_file(month)
+        write_csv_atomic(visits_with_date_columns(df), month_file)
+        
+        self._visit_catalog[month] = {
+            'source': ColumnSnapshot.source_stamp(month_file),
+            'rows': len(df),
+            'last_visit_id': int(df['visit_id'].max()) if len(df) else 0
+        }
+        
+        # The snapshot matches the file that was just written
+        self._write_snapshot(self._visit_month_snapshot(month), df, month_file)
+    
+    def _write_snapshot(self, snapshot, df, source_file):
+        """Write a binary snapshot, keeping the CSV if it fails"""
+        if snapshot is None:
+            return
+        try:
+            snapshot.write(df, source_file)
+        except Exception as e:
+            print(f"Error writing snapshot for {source_file}: {e}")
+    
+    def write_snapshots(self):
+        """Refresh any snapshot that no longer matches its CSV file"""
+        with self._lock:
+            customers = self._customers_df.copy()
+            self._fold_pending_visits()
+            # Months that were never loaded still have their snapshot
+            visit_months = {month: self._visit_partitions.frame(month).copy()
+                            for month in self._visit_partitions.loaded_months()
+                            if month not in self._dirty_visit_months}
+        
+        if self.customers_snapshot is not None and not self.customers_snapshot.is_fresh(self.customers_file):
+            self._write_snapshot(self.customers_snapshot, customers, self.customers_file)
+        for month, df in visit_months.items():
+            month_file = self._visit_month_file(month)
+            snapshot = self._visit_month_snapshot(month)
+            if snapshot is not None and os.path.exists(month_file) and not snapshot.is_fresh(month_file):
+                self._write_snapshot(snapshot, df, month_file)
+    
+    def _compaction_loop(self):
+        """Background thread: compact on an interval or when the journal grows"""
+        while not self._stop_compactor.is_set():
+            self._compact_wakeup.wait(self.compact_interval)
+            self._compact_wakeup.clear()
+            if self._stop_compactor.is_set():
+                break
+            try:
+                self.compact_journal()
+            except Exception as e:
+                print(f"Error compacting visit journal: {e}")
+    
+    def flush(self, timeout=None):
+        """Wait until every write made so far is on disk
+        
+        Returns:
+            True if everything was written (always True without write_behind)
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+    
+    def _commit_writes(self, records, keys):
+        """Write one batch from the group-commit writer
+        
+        Args:
+            records: Journal records queued since the last batch, in order
+            keys: Files to rewrite ('customers', 'visits')
+        """
+        # A batch holds either journal records or file marks, never both, so
+        # a failed batch is retried whole without repeating finished work
+        # (a failed journal append cuts off its partial write)
+        if records:
+            # Under the lock so a compaction can't move the journal mid-append
+            with self._lock:
+                self.journal.append_many(records)
+            if self.journal.record_count >= self.compact_threshold:
+                self._compact_wakeup.set()
+        if keys:
+            # Files are only marked without a journal. Written under the
+            # compaction lock, like a compaction, so a backup never copies
+            # them halfway through a batch
+            with self._compact_lock:
+                if 'customers' in keys:
+                    self.save_customers()
+                if 'visits' in keys:
+                    self.save_visits()
+    
+    def close(self):
+        """Stop background work and fold any outstanding journal records"""
+        self._wait_for_backup()
+        
+        if self._writer is not None:
+            if not self._writer.close(timeout=30):
+                print("Warning: some queued writes could not be saved")
+            self._writer = None
+        
+        if self._compactor is not None:
+            self._stop_compactor.set()
+            self._compact_wakeup.set()
+            self._compactor.join()
+            self._compactor = None
+        
+        if self.journal is not None:
+            self.compact_journal()
+        
+        # Next startup can skip parsing the CSV files
+        self.write_snapshots()
+    
+    # Online backups - see online_backup.py for the storage format
+    def backup(self, backup_dir=None, keep=BACKUP_GENERATIONS):
+        """Back up the data folder while the application keeps running
+        
+        The files are captured as they are at one instant (see
+        _capture_backup), then compressed into the backup folder outside
+        the lock, so check-ins carry on while the backup is written. Only
+        chunks that changed since the last backup are stored, and the
+        oldest generations beyond `keep` are removed.
+        
+        Args:
+            backup_dir: Backup folder; defaults to 'backups' next to the data folder
+            keep: Number of backup generations to keep
+        
+        Returns:
+            Summary dict (generation, files, changed_files, bytes_written),
+            or None if the backup failed
+        """
+        if backup_dir is None:
+            backup_dir = default_backup_dir(self.data_dir)
+        
+        with self._backup_lock:
+            staging_dir = os.path.join(self.data_dir, STAGING_DIR)
+            try:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                os.makedirs(staging_dir)
+                store = BackupStore(backup_dir, keep)
+                files = self._capture_backup(staging_dir, store.latest_stamps())
+                return store.write(files, self._backup_engine())
+            except Exception as e:
+                print(f"Error backing up {self.data_dir}: {e}")
+                return None
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    def start_backup(self, backup_dir=None, keep=BACKUP_GENERATIONS, callback=None):
+        """Run backup() on a background thread
+        
+        Args:
+            backup_dir: Backup folder, see backup()
+            keep: Number of backup generations to keep
+            callback: Optional callable receiving backup()'s result; it runs
+                on the backup thread
+        
+        Returns:
+            The backup thread, or None if a backup is already running
+        """
+        if self._backup_thread is not None and self._backup_thread.is_alive():
+            return None
+        
+        def run():
+            result = self.backup(backup_dir, keep)
+            if callback is not None:
+                callback(result)
+        
+        self._backup_thread = threading.Thread(target=run, name="data-backup", daemon=True)
+        self._backup_thread.start()
+        return self._backup_thread
+    
+    def _wait_for_backup(self):
+        """Let a running backup finish before the files are closed"""
+        if self._backup_thread is not None:
+            self._backup_thread.join()
+            self._backup_thread = None
+    
+    def _backup_engine(self):
+        """Name of the storage engine recorded with each backup"""
+        return "csv"
+    
+    def _capture_backup(self, staging_dir, stored_stamps):
+        """Stage a consistent copy of the data files for a backup
+        
+        The files are copied under the compaction lock and the data lock,
+        so no compaction, journal append or file rewrite happens in between:
+        single edits rewrite their file under the data lock, and the
+        write-behind batches and bulk saves that write several files do so
+        under the compaction lock. Nothing is left open on a live file
+        afterwards (on Windows that would make the atomic replace of the
+        next save fail). A file whose size and modification time match the
+        last backup is not copied at all, so usually only the current
+        month, customers.csv and the journal are - a few milliseconds of
+        waiting for check-ins.
+        
+        Args:
+            staging_dir: Empty folder inside the data folder
+            stored_stamps: {relative path: stamp} of the last backup
+        
+        Returns:
+            {relative path: (staged file or None, stamp or None, size or None)}
+            for BackupStore.write()
+        
+        Raises:
+            TimeoutError: Queued writes could not be saved in time
+        """
+        # Writes still queued are part of the backup; a writer that keeps
+        # failing must not hold up the backup (and close()) for ever
+        if not self.flush(self.BACKUP_FLUSH_TIMEOUT):
+            raise TimeoutError("queued writes could not be saved, backup skipped")
+        
+        files = {}
+        with self._compact_lock:
+            with self._lock:
+                for rel_path in self._backup_sources():
+                    source = os.path.join(self.data_dir, *rel_path.split("/"))
+                    staged = os.path.join(staging_dir, *rel_path.split("/"))
+                    
+                    if self.journal is not None and os.path.abspath(source) in (
+                            os.path.abspath(self.journal.path), os.path.abspath(self.journal.compacting_path)):
+                        # Appended to in place, so never matched by its stamp
+                        stamp = None
+                    else:
+                        stamp = file_stamp(source)
+                        if stamp == stored_stamps.get(rel_path):
+                            # Unchanged - the last backup's chunks are reused
+                            files[rel_path] = (None, stamp, None)
+                            continue
+                    
+                    os.makedirs(os.path.dirname(staged), exist_ok=True)
+                    shutil.copyfile(source, staged)
+                    files[rel_path] = (staged, stamp, None)
+        return files
+    
+    def _backup_sources(self):
+        """Data files a backup covers, relative to the data folder"""
+        return backup_files(self.data_dir)
+    
+    # Persistence hooks - the CSV engine rewrites the whole file, other
+    # storage engines (see sqlite_manager.py) override these to write one row
+    def _persist_customer_insert(self, customer):
+        """Persist a newly added customer row"""
+        self._log_customer_change('add_customer', customer)
+    
+    def _persist_customer_update(self, customer_id, changes):
+        """Persist changed fields of an existing customer"""
+        self._log_customer_change('update_customer', dict(changes, id=customer_id))
+    
+    def _persist_customer_delete(self, customer_id):
+        """Persist the removal of a customer"""
+        self._log_customer_change('delete_customer', {'id': customer_id})
+    
+    def _log_customer_change(self, op, row):
+        """Log a customer change to the journal, or rewrite customers.csv"""
+        if self.journal is None:
+            self._save_customers_later()
+            return
+        
+        # customers.csv is rewritten by the next compaction
+        self._customers_dirty = True
+        self._append_journal(op, row)
+    
+    def _append_journal(self, op, row):
+        """Append one record to the journal, now or with the writer's next batch"""
+        if self._writer is not None:
+            # Appended with the rest of the batch under one fsync
+            self._writer.append((op, row))
+            return
+        self.journal.append(op, row)
+        if self.journal.record_count >= self.compact_threshold:
+            self._compact_wakeup.set()
+    
+    def _save_customers_later(self):
+        """Rewrite customers.csv now, or on the writer's next batch"""
+        if self._writer is not None:
+            # Several edits before the next batch cost a single rewrite
+            self._writer.mark('customers')
+        else:
+            self.save_customers()
+    
+    def _persist_visit_insert(self, visit):
+        """Persist a newly added visit row"""
+        if self.journal is not None:
+            self._append_journal('add_visit', visit)
+            return
+        
+        # Rewrites only the month the visit belongs to
+        if self._writer is not None:
+            self._writer.mark('visits')
+        else:
+            self.save_visits()
+    
+    def _persist_visit_points(self, month, visits):
+        """Persist re-scored visits of one month (call with the lock held)"""
+        # Written with the month by the next save_visits()
+        self._dirty_visit_months.add(month)
+    
+    def _persist_customers_bulk(self, customers):
+        """Persist many new customer rows as one commit"""
+        if self.journal is None:
+            # Not under the data lock, so kept apart from a backup this way
+            with self._compact_lock:
+                self.save_customers()
+            return
+        self._customers_dirty = True
+        self._append_journal_batch('add_customer', customers)
+    
+    def _persist_visits_bulk(self, visits):
+        """Persist many new visit rows as one commit"""
+        if self.journal is None:
+            # Several month files and the catalog - kept apart from a backup
+            with self._compact_lock:
+                self.save_visits()
+            return
+        self._append_journal_batch('add_visit', visits)
+    
+    def _append_journal_batch(self, op, rows):
+        """Append many records to the journal under a single fsync"""
+        # Writes still queued go first so the journal keeps them in order
+        self.flush()
+        with self._lock:
+            self.journal.append_many([(op, row) for row in rows])
+        if self.journal.record_count >= self.compact_threshold:
+            self._compact_wakeup.set()
+    
+    def _next_visit_id(self):
+        """Return the ID to use for the next visit"""
+        return self.reserve_ids('visit_id')[0]
+    
+    def _sync_sequences(self):
+        """Make sure the ID counters are past every stored customer and visit
+        
+        Covers data written before the counters existed, or copied in by hand
+        """
+        max_customer_id = 0
+        if len(self._customers_df) > 0:
+            max_id = pd.to_numeric(self._customers_df['id'], errors='coerce').max()
+            if not pd.isna(max_id):
+                max_customer_id = int(max_id)
+        self.sequences.ensure_at_least('customer_id', max_customer_id)
+        self.sequences.ensure_at_least('visit_id', self._last_visit_id)
+    
+    def reserve_ids(self, name, count=1):
+        """Reserve a block of consecutive IDs, e.g. for a bulk import
+        
+        Args:
+            name: 'customer_id' or 'visit_id'
+            count: Number of IDs wanted
+        
+        Returns:
+            A range of IDs no other caller or process will be given
+        """
+        return self.sequences.reserve(name, count)
+    
+    def _next_customer_id(self):
+        """Return the ID to use for the next customer"""
+        return self.reserve_ids('customer_id')[0]
+    
+    def customer_version(self, customer_id):
+        """Version of a customer row for optimistic update checks
+        
+        Returns:
+            None - the CSV engine is single-terminal and keeps no versions
+            (see sqlite_manager.py for the shared engine)
+        """
+        return None
+    
+    def add_customer(self, name, phone, age_group, location, occupation, qr_code_path):
+        """Add a new customer to the database"""
+        customer_id = self._next_customer_id()
+        
+        print(f"Adding new customer with ID: {customer_id}, type: {type(customer_id)}")
+        
+        new_customer = {
+            'id': customer_id,
+            'name': str(name),
+            'phone': normalize_phone(phone),  # Canonical 10-digit string
+            'age_group': str(age_group),
+            'location': str(location),
+            'occupation': str(occupation),
+            'qr_code_path': str(qr_code_path),
+            'registration_date': datetime.now().strftime('%Y-%m-%d')
+        }
+        
+        with self._lock:
+            # Typed append keeps int32 IDs and categorical columns
+            self._customers_df = append_rows(self._customers_df, pd.DataFrame([new_customer]), CUSTOMER_SCHEMA)
+            
+            # The new row is always the last position
+            self._id_index.setdefault(customer_id, len(self._customers_df) - 1)
+            self._phone_index.add(customer_id, new_customer['phone'])
+            self._name_index.add(customer_id, new_customer['name'])
+            
+            self._persist_customer_insert(new_customer)
+        
+        self.events.publish(ChangeEvent(CUSTOMER_ADDED, customer_id, new_customer))
+        return customer_id
+    
+    def add_customers_bulk(self, customers):
+        """Add many customers with one ID reservation and a single commit
+        
+        Args:
+            customers: DataFrame in the customers.csv layout; any 'id'
+                column is ignored and phones are normalized
+        
+        Returns:
+            List of the new customer IDs, in row order
+        """
+        if customers is None or len(customers) == 0:
+            return []
+        
+        df = customers.drop(columns=['id'], errors='ignore').reset_index(drop=True)
+        if 'phone' in df.columns:
+            df['phone'] = df['phone'].map(normalize_phone)
+        today = datetime.now().strftime('%Y-%m-%d')
+        if 'registration_date' in df.columns:
+            df['registration_date'] = df['registration_date'].fillna('').astype(str).replace('', today)
+        else:
+            df['registration_date'] = today
+        
+        with self._lock:
+            ids = self.reserve_ids('customer_id', len(df))
+            df.insert(0, 'id', list(ids))
+            new_customers = apply_schema(df, CUSTOMER_SCHEMA)[list(CUSTOMER_SCHEMA)]
+            # One concat and one index rebuild for the whole batch
+            self.customers_df = append_rows(self._customers_df, new_customers, CUSTOMER_SCHEMA)
+            records = new_customers.astype({'id': 'int64'}).to_dict('records')
+        
+        self._persist_customers_bulk(records)
+        self.events.publish([ChangeEvent(CUSTOMER_ADDED, record['id'], record) for record in records])
+        return list(ids)
+    
+    def update_customer(self, customer_id, expected_version=None, **kwargs):
+        """Update customer details
+        
+        Args:
+            customer_id: ID of the customer to change
+            expected_version: Version from customer_version() when the
+                customer was read; if another terminal has changed the
+                customer since, the update is refused
+            **kwargs: Columns to change
+        
+        Returns:
+            True if the customer was updated
+        """
+        try:
+            with self._lock:
+                position = self._customer_position(customer_id)
+                
+                if position is None:
+                    print(f"Customer with ID {customer_id} not found for update")
+                    return False
+                
+                current_version = self.customer_version(customer_id)
+                if expected_version is not None and current_version is not None \
+                        and current_version != expected_version:
+                    print(f"Customer with ID {customer_id} was changed on another terminal, not updating")
+                    return False
+                
+                changes = {}
+                for key, value in kwargs.items():
+                    if key == 'id':
+                        # Changing the key would invalidate the id index
+                        print("Customer ID cannot be changed with update_customer")
+                        continue
+                    if key in self._customers_df.columns:
+                        # Ensure text values are stored as strings
+                        if key == 'phone':
+                            value = normalize_phone(value)
+                        elif key in ['name', 'age_group', 'location', 'occupation', 'qr_code_path']:
+                            value = str(value)
+                        
+                        # Categorical columns only accept known categories
+                        if CUSTOMER_SCHEMA.get(key) == 'category':
+                            column = self._customers_df[key]
+                            if value not in column.cat.categories:
+                                self._customers_df[key] = column.cat.add_categories([value])
+                        self._customers_df.at[position, key] = value
+                        changes[key] = value
+                
+                customer_key = int(self._customers_df.at[position, 'id'])
+                if 'phone' in changes:
+                    self._phone_index.remove(customer_key)
+                    self._phone_index.add(customer_key, changes['phone'])
+                if 'name' in changes:
+                    self._name_index.remove(customer_key)
+                    self._name_index.add(customer_key, changes['name'])
+                
+                self._persist_customer_update(self._customers_df.at[position, 'id'], changes)
+                row = self._customers_df.iloc[position].to_dict()
+            
+            self.events.publish(ChangeEvent(CUSTOMER_UPDATED, customer_key, row, changes))
+            return True
+        except Exception as e:
+            print(f"Error updating customer with ID {customer_id}: {e}")
+            # A refused update may have reloaded the customer; subscribers
+            # hear about it now that the lock is released
+            self.events.publish(getattr(e, 'events', []))
+            return False
+    
+    def delete_customer(self, customer_id):
+        """Delete a customer from the database"""
+        try:
+            with self._lock:
+                position = self._customer_position(customer_id)
+                
+                if position is None:
+                    print(f"Customer with ID {customer_id} not found for deletion")
+                    return False
+                
+                deleted_id = self._customers_df.at[position, 'id']
+                deleted_row = self._customers_df.iloc[position].to_dict()
+                
+                try:
+                    deleted_key = int(deleted_id)
+                except (ValueError, TypeError):
+                    deleted_key = None
+                
+                # Rows after the deleted one shift up, so only their
+                # positions change; the search indexes are keyed by ID
+                self._customers_df = self._customers_df.drop(index=position).reset_index(drop=True)
+                self._unindex_customer_position(position, deleted_key)
+                if deleted_key is not None:
+                    self._phone_index.remove(deleted_key)
+                    self._name_index.remove(deleted_key)
+                
+                self._persist_customer_delete(deleted_id)
+            
+            self.events.publish(ChangeEvent(CUSTOMER_DELETED, deleted_row['id'], deleted_row))
+            return True
+        except Exception as e:
+            print(f"Error deleting customer with ID {customer_id}: {e}")
+            return False
+    
+    def customer_ids_by_phone(self, phones):
+        """Look up many phone numbers at once
+        
+        Args:
+            phones: Phone numbers in any format
+        
+        Returns:
+            Dictionary of canonical phone -> first customer ID with that
+            phone, for the registered phones only
+        """
+        found = {}
+        with self._lock:
+            for phone in phones:
+                phone = normalize_phone(phone)
+                if phone and phone not in found:
+                    customer_ids = self._phone_index.lookup(phone)
+                    if customer_ids:
+                        found[phone] = customer_ids[0]
+        return found
+    
+    def get_customer(self, customer_id):
+        """Get customer details by ID"""
+        try:
+            with self._lock:
+                position = self._customer_position(customer_id)
+                
+                if position is None:
+                    print(f"Customer with ID {customer_id} not found")
+                    return None
+                
+                return self._customers_df.iloc[position].to_dict()
+        except Exception as e:
+            print(f"Error getting customer with ID {customer_id}: {e}")
+            return None
+    
+    def _customers_by_ids(self, customer_ids):
+        """Customer dictionaries for a list of IDs, skipping unknown IDs"""
+        customers = []
+        for customer_id in customer_ids:
+            position = self._id_index.get(customer_id)
+            if position is not None:
+                customers.append(self._customers_df.iloc[position].to_dict())
+        return customers
+    
+    def find_customers_by_phone(self, phone):
+        """Get customers with exactly this phone number (any format)"""
+        with self._lock:
+            return self._customers_by_ids(self._phone_index.lookup(phone))
+    
+    def search_phone_prefix(self, prefix, limit=20):
+        """Get customers whose phone number starts with the given digits"""
+        with self._lock:
+            return self._customers_by_ids(self._phone_index.prefix(prefix, limit))
+    
+    def search_phone_digits(self, digits, limit=20):
+        """Get customers whose phone number contains the digits anywhere"""
+        with self._lock:
+            return self._customers_by_ids(self._phone_index.contains(digits, limit))
+    
+    def search_names(self, query, limit=10, fuzzy=True):
+        """Get customers ranked by how well their name matches the query
+        
+        Exact name first, then names starting with the query, then names
+        containing it, then close (typo) matches. Fast enough to run on
+        every keystroke.
+        
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of customers
+            fuzzy: Include close (typo) matches. A typo match can be a
+                different person ("Brian Otieno" for "Brian Odhiambo"), so
+                pass False when the result decides who gets a visit
+        """
+        with self._lock:
+            return self._customers_by_ids(self._name_index.search(query, limit, fuzzy=fuzzy))
+    
+    def find_names_containing(self, text):
+        """Get the IDs of all customers whose name contains the text"""
+        with self._lock:
+            return self._name_index.containing(text)
+    
+    def add_visit(self, customer_id, game_genre, console, payment_method, 
+                 payment_amount, snacks_amount, referrals, snacks_details=""):
+        """
+        Add a new visit to the database
+        
+        Note: The 'referrals' parameter is now used to store the 'friends_number' value
+        but the database column name remains 'referrals' for backward compatibility
+        """
+        # Calculate points based on payment amount
+        points = self.points.points_for(payment_amount)
+        
+        now = datetime.now().replace(microsecond=0)
+        
+        with self._lock:
+            visit_id = self._next_visit_id()
+            
+            # Row in the CSV layout - this is what gets persisted
+            new_visit = {
+                'visit_id': visit_id,
+                'customer_id': customer_id,
+                'date': now.strftime('%Y-%m-%d'),
+                'time': now.strftime('%H:%M:%S'),
+                'game_genre': game_genre,
+                'console': console,
+                'payment_method': payment_method,
+                'payment_amount': payment_amount,
+                'snacks_amount': snacks_amount,
+                'snacks_details': snacks_details,
+                'referrals': referrals,  # This stores the friends_number value
+                'points': points  # Add points based on payment amount
+            }
+            
+            self._last_visit_id = max(self._last_visit_id, visit_id)
+            
+            # Buffer the typed row; it is folded into its month in chunks
+            month = month_key(now)
+            pending = {key: value for key, value in new_visit.items() if key not in ('date', 'time')}
+            pending['visited_at'] = now
+            month_rows = self._pending_visits.setdefault(month, [])
+            month_rows.append(pending)
+            self._dirty_visit_months.add(month)
+            if len(month_rows) >= self.VISIT_CHUNK_SIZE:
+                self._fold_pending_visits([month])
+            
+            # Keep the day's sales totals current
+            self._daily.add(new_visit['date'], customer_id, game_genre, console,
+                            payment_method, payment_amount, snacks_amount)
+            self._customer_stats.add(customer_id, now, payment_amount, snacks_amount, points)
+            
+            self._persist_visit_insert(new_visit)
+        
+        self.events.publish(ChangeEvent(VISIT_ADDED, visit_id, new_visit))
+        return visit_id
+    
+    def add_visits_bulk(self, visits):
+        """Add many visits with one ID reservation and a single commit
+        
+        Args:
+            visits: DataFrame in the visits.csv layout (date and time as
+                text); any 'visit_id' column is ignored and missing points
+                are scored with the points tiers
+        
+        Returns:
+            List of the new visit IDs, in row order
+        """
+        if visits is None or len(visits) == 0:
+            return []
+        
+        # Only the visit columns; a new ID is given to every row
+        columns = [col for col in VISIT_COLUMNS if col in visits.columns and col != 'visit_id']
+        typed = self._prepare_visits(visits[columns].reset_index(drop=True))
+        
+        with self._lock:
+            ids = self.reserve_ids('visit_id', len(typed))
+            typed['visit_id'] = pd.array(list(ids), dtype='int32')
+            # Also updates the daily aggregates and the customer stats
+            self._dirty_visit_months.update(self._merge_visits(typed))
+            self._trim_resident_visits()
+        
+        # Plain Python values in the CSV layout, as add_visit journals them
+        records = visits_with_date_columns(typed)[VISIT_COLUMNS].astype(
+            {'visit_id': 'int64', 'customer_id': 'int64', 'referrals': 'int64', 'points': 'int64'})
+        for column in ('payment_amount', 'snacks_amount'):
+            records[column] = records[column].astype('float64').round(2)
+        records = records.to_dict('records')
+        self._persist_visits_bulk(records)
+        self.events.publish([ChangeEvent(VISIT_ADDED, record['visit_id'], record) for record in records])
+        return list(ids)
+    
+    def _visits_for_customer(self, customer_id):
+        """Typed visits of one customer
+        
+        Only the months between the customer's first and last visit are read
+        """
+        stats = self.get_customer_stats(customer_id)
+        if stats['visits'] == 0:
+            return self._visit_partitions.empty.copy()
+        
+        with self._lock:
+            known = self._visit_partitions.months | set(self._pending_visits)
+            months = [UNDATED] if UNDATED in known else []
+            if stats['first_visit'] is not None:
+                start = stats['first_visit'].normalize()
+                end = stats['last_visit'].normalize() + pd.Timedelta(days=1)
+                months += months_overlapping(known, start, end)
+            self._fold_pending_visits(months)
+            visits = self._visit_partitions.combined(months)
+            self._trim_resident_visits()
+        return visits[visits['customer_id'] == int(customer_id)]
+    
+    def get_customer_stats(self, customer_id):
+        """Get a customer's visit statistics
+        
+        The stats table is built from all visits on first use and kept
+        current by add_visit, so this is a dictionary lookup
+        
+        Returns:
+            Dictionary with visits, first_visit, last_visit (Timestamps or
+            None), total_spent and total_points
+        """
+        with self._lock:
+            if not self._customer_stats.is_built:
+                # One month at a time, so history never has to fit in memory at once
+                self._customer_stats.build_from(frame for _, frame in self._iter_visit_months())
+            return self._customer_stats.get(customer_id)
+    
+    def _visits_in_range(self, start_date, end_date):
+        """Typed visits between two dates (inclusive, 'YYYY-MM-DD')
+        
+        Only the months overlapping the range are read, and within each
+        month the rows are found by binary search on 'visited_at'
+        """
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+        
+        with self._lock:
+            months = months_overlapping(self._visit_partitions.months | set(self._pending_visits), start, end)
+            self._fold_pending_visits(months)
+            # Binary search on the sorted 'visited_at' column of each month
+            visits = self._visit_partitions.time_range(months, start, end)
+            self._trim_resident_visits()
+            return visits
+    
+    def get_visits_by_customer(self, customer_id):
+        """Get all visits for a specific customer"""
+        return visits_with_date_columns(self._visits_for_customer(customer_id))
+    
+    def get_visits_by_date_range(self, start_date, end_date):
+        """Get all visits within a date range"""
+        return visits_with_date_columns(self._visits_in_range(start_date, end_date))
+    
+    def _daily_totals(self, start_date, end_date):
+        """Per-day totals between two dates (inclusive, 'YYYY-MM-DD')
+        
+        Months are aggregated the first time they are asked for; after that
+        add_visit keeps them current, so this costs O(days in range)
+        
+        Returns:
+            A list of (day, totals) tuples in date order
+        """
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+        
+        with self._lock:
+            months = months_overlapping(self._visit_partitions.months | set(self._pending_visits), start, end)
+            for month in months:
+                if not self._daily.has_month(month):
+                    self._fold_pending_visits([month])
+                    self._daily.build_month(month, self._visit_partitions.frame(month))
+            self._trim_resident_visits()
+            return self._daily.days(months, start.strftime('%Y-%m-%d'),
+                                    (end - pd.Timedelta(days=1)).strftime('%Y-%m-%d'))
+    
+    def get_sales_by_date_range(self, start_date, end_date):
+        """Get sales data within a date range"""
+        days = self._daily_totals(start_date, end_date)
+        
+        if not days:
+            return {
+                'total_gaming': 0,
+                'total_snacks': 0,
+                'total_sales': 0,
+                'total_visits': 0,
+                'unique_customers': 0,
+                'daily_sales': {}
+            }
+        
+        # Sum the per-day totals
+        daily_sales_dict = {}
+        total_gaming = 0.0
+        total_snacks = 0.0
+        total_visits = 0
+        customers = set()
+        for day, totals in days:
+            daily_sales_dict[day] = {
+                'gaming': totals['gaming'],
+                'snacks': totals['snacks'],
+                'total': totals['gaming'] + totals['snacks'],
+                'visits': totals['visits']
+            }
+            total_gaming += totals['gaming']
+            total_snacks += totals['snacks']
+            total_visits += totals['visits']
+            customers |= totals['customers']
+        
+        return {
+            'total_gaming': total_gaming,
+            'total_snacks': total_snacks,
+            'total_sales': total_gaming + total_snacks,
+            'total_visits': total_visits,
+            'unique_customers': len(customers),
+            'daily_sales': daily_sales_dict
+        }
+    
+    def get_daily_totals(self, start_date, end_date):
+        """Get one row per day with visits in a date range
+        
+        Returns:
+            DataFrame with date, gaming, snacks, visits and customers
+            (unique customers that day) columns
+        """
+        rows = [{
+            'date': day,
+            'gaming': totals['gaming'],
+            'snacks': totals['snacks'],
+            'visits': totals['visits'],
+            'customers': len(totals['customers'])
+        } for day, totals in self._daily_totals(start_date, end_date)]
+        return pd.DataFrame(rows, columns=['date', 'gaming', 'snacks', 'visits', 'customers'])
+    
+    def get_customer_visit_frequency(self, customer_id):
+        """Get visit frequency for a specific customer"""
+        stats = self.get_customer_stats(customer_id)
+        
+        if stats['visits'] == 0 or stats['first_visit'] is None:
+            return {
+                'total_visits': 0,
+                'first_visit': None,
+                'last_visit': None,
+                'frequency': 'N/A'
+            }
+        
+        # First and last visit from the rolling stats
+        first_date = stats['first_visit'].normalize()
+        last_date = stats['last_visit'].normalize()
+        total_visits = stats['visits']
+        
+        # Calculate days between first and last visit
+        days_diff = (last_date - first_date).days
+        
+        if days_diff == 0:
+            frequency = 'First Visit'
+        elif days_diff <= 7:
+            frequency = 'Weekly'
+        elif days_diff <= 30:
+            frequency = 'Monthly'
+        else:
+            frequency = 'Occasional'
+        
+        return {
+            'total_visits': total_visits,
+            'first_visit': first_date.strftime('%Y-%m-%d'),
+            'last_visit': last_date.strftime('%Y-%m-%d'),
+            'frequency': frequency
+        }
+    
+    def get_shift_summary(self, date=None):
+        """Get summary for the current shift (or specified date)"""
+        if date is None:
+            date = datetime.now().strftime('%Y-%m-%d')
+        
+        days = self._daily_totals(date, date)
+        
+        if not days:
+            return {
+                'date': date,
+                'total_customers': 0,
+                'total_gaming': 0,
+                'total_snacks': 0,
+                'total_sales': 0,
+                'payment_methods': {},
+                'consoles': {},
+                'game_genres': {}
+            }
+        
+        # A single day - its totals are already aggregated
+        totals = days[0][1]
+        
+        return {
+            'date': date,
+            'total_customers': len(totals['customers']),
+            'total_gaming': totals['gaming'],
+            'total_snacks': totals['snacks'],
+            'total_sales': totals['gaming'] + totals['snacks'],
+            'payment_methods': {method: dict(values) for method, values in totals['payment_methods'].items()},
+            'consoles': dict(totals['consoles']),
+            'game_genres': dict(totals['game_genres'])
+        }
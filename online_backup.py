@@ -0,0 +1,345 @@
+"""
+Online, incremental backups of the data folder for Trinix Gaming Shop
+
+A backup generation is a small manifest listing every data file as a list
+of compressed 1 MB chunks. Chunks are stored once, by their SHA-256, so a
+new generation only writes the chunks that changed since the last one
+(usually the current month's visits and the journal). Old generations are
+rotated out and chunks no generation uses any more are deleted.
+
+The running application takes backups through DatabaseManager.backup() /
+start_backup(). This script lists and restores them (close the
+application before restoring):
+
+    python online_backup.py list
+    python online_backup.py restore                      # newest generation
+    python online_backup.py restore 20261017-183000 --data-dir data
+"""
+import os
+import sys
+import json
+import time
+import zlib
+import hashlib
+import argparse
+from datetime import datetime
+
+# Bytes per stored chunk
+CHUNK_SIZE = 1024 * 1024
+
+# Generations kept by default
+BACKUP_GENERATIONS = 14
+
+# Unused chunks younger than this may belong to a backup still being
+# written by another terminal, so rotate() leaves them alone
+UNUSED_CHUNK_GRACE = 3600
+
+# Folder inside the data folder where a backup stages its consistent copy
+STAGING_DIR = ".backup-staging"
+
+# Derived or temporary data that is never backed up: the binary snapshots
+# are rebuilt from the CSV files, lock files belong to the running
+# processes, and SQLite's side files belong to the open connection (the
+# database itself is copied with SQLite's backup API)
+EXCLUDED_DIRS = ("snapshot", STAGING_DIR)
+EXCLUDED_SUFFIXES = (".tmp", ".lock", "-wal", "-shm", "-journal")
+
+
+def default_backup_dir(data_dir):
+    """The 'backups' folder next to the data folder"""
+    return os.path.join(os.path.dirname(os.path.abspath(data_dir)), "backups")
+
+
+def backup_files(data_dir):
+    """Data files a backup covers, as paths relative to data_dir
+
+    Returns:
+        Sorted list of relative paths using '/' separators
+    """
+    files = []
+    for root, dirs, names in os.walk(data_dir):
+        if root == data_dir:
+            dirs[:] = [name for name in dirs if name not in EXCLUDED_DIRS]
+        for name in names:
+            if name.endswith(EXCLUDED_SUFFIXES):
+                continue
+            path = os.path.join(root, name)
+            files.append(os.path.relpath(path, data_dir).replace(os.sep, "/"))
+    return sorted(files)
+
+
+def file_stamp(path):
+    """Size and modification time, used to skip re-reading unchanged files"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class BackupStore:
+    """
+    Chunked, compressed, deduplicated backup generations in one folder
+    Layout: generations/<name>.json manifests and objects/<ab>/<sha256>
+    zlib-compressed chunks. A manifest is written last, so an interrupted
+    backup never shows up as a generation.
+    """
+
+    def __init__(self, backup_dir, keep=BACKUP_GENERATIONS):
+        """Initialize the store
+
+        Args:
+            backup_dir: Folder holding the backups (created if needed)
+            keep: Number of generations kept by rotate()
+        """
+        self.backup_dir = backup_dir
+        self.keep = max(1, int(keep))
+        self.generations_dir = os.path.join(backup_dir, "generations")
+        self.objects_dir = os.path.join(backup_dir, "objects")
+
+    def generations(self):
+        """Names of the stored generations, oldest first"""
+        if not os.path.isdir(self.generations_dir):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.generations_dir) if name.endswith(".json"))
+
+    def read_manifest(self, generation):
+        """Load one generation's manifest"""
+        with open(os.path.join(self.generations_dir, generation + ".json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def latest_stamps(self):
+        """{relative path: stamp} of the newest generation ({} if there is none)"""
+        generations = self.generations()
+        if not generations:
+            return {}
+        try:
+            files = self.read_manifest(generations[-1])['files']
+        except Exception as e:
+            print(f"Error reading the last backup manifest: {e}")
+            return {}
+        return {rel_path: entry.get('stamp') for rel_path, entry in files.items() if entry.get('stamp')}
+
+    def _object_path(self, digest):
+        """Where a chunk with the given SHA-256 is stored"""
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    @staticmethod
+    def _write_durably(path, data):
+        """Write bytes to a temporary file, fsync it and rename it into place"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _store_file(self, path, size=None):
+        """Store a file's chunks, writing only those not stored yet
+
+        Args:
+            path: File to store
+            size: Only store this many bytes (for a file still being appended to)
+
+        Returns:
+            (list of chunk digests, bytes of new compressed chunks)
+        """
+        chunks = []
+        written = 0
+        remaining = size
+        with open(path, 'rb') as f:
+            while remaining is None or remaining > 0:
+                data = f.read(CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining))
+                if not data:
+                    break
+                if remaining is not None:
+                    remaining -= len(data)
+
+                digest = hashlib.sha256(data).hexdigest()
+                chunks.append(digest)
+                object_path = self._object_path(digest)
+                if os.path.exists(object_path):
+                    # Fresh again, so a rotation running elsewhere keeps it
+                    os.utime(object_path)
+                    continue
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                compressed = zlib.compress(data, 6)
+                self._write_durably(object_path, compressed)
+                written += len(compressed)
+        return chunks, written
+
+    def _new_generation_name(self):
+        """Timestamp name for a new generation, sorting after every stored one"""
+        name = datetime.now().strftime('%Y%m%d-%H%M%S')
+        generations = self.generations()
+        candidate, n = name, 1
+        # Several backups within one second get a counter
+        while generations and candidate <= generations[-1]:
+            candidate = f"{name}-{n:03d}"
+            n += 1
+        return candidate
+
+    def write(self, files, engine="csv"):
+        """Store a new generation
+
+        Args:
+            files: {relative path: (staged file, stamp or None, size or None)}.
+                A file whose stamp matches the previous generation reuses its
+                chunks without being read (its staged file may then be
+                None); size limits how much is stored
+            engine: Storage engine the files belong to ('csv' or 'sqlite')
+
+        Returns:
+            Summary dict with generation, files, changed_files and bytes_written
+        """
+        previous = {}
+        generations = self.generations()
+        if generations:
+            try:
+                previous = self.read_manifest(generations[-1])['files']
+            except Exception as e:
+                print(f"Error reading the last backup manifest, storing every file: {e}")
+
+        entries = {}
+        changed_files = 0
+        bytes_written = 0
+        for rel_path, (staged_path, stamp, size) in sorted(files.items()):
+            old = previous.get(rel_path)
+            if stamp is not None and old is not None and old.get('stamp') == stamp:
+                entries[rel_path] = old
+                continue
+            if staged_path is None:
+                # Another terminal stored a generation since the capture
+                raise ValueError(f"{rel_path} was not staged and the last backup has changed")
+
+            chunks, written = self._store_file(staged_path, size)
+            entries[rel_path] = {
+                'size': size if size is not None else os.path.getsize(staged_path),
+                'stamp': stamp,
+                'chunks': chunks
+            }
+            bytes_written += written
+            if old is None or old['chunks'] != chunks:
+                changed_files += 1
+
+        generation = self._new_generation_name()
+        manifest = {
+            'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'engine': engine,
+            'files': entries
+        }
+        os.makedirs(self.generations_dir, exist_ok=True)
+        self._write_durably(os.path.join(self.generations_dir, generation + ".json"),
+                            json.dumps(manifest, indent=1).encode('utf-8'))
+
+        self.rotate()
+        return {
+            'generation': generation,
+            'files': len(entries),
+            'changed_files': changed_files,
+            'bytes_written': bytes_written
+        }
+
+    def rotate(self):
+        """Drop generations beyond `keep` and the chunks only they used
+
+        Returns:
+            Number of chunks deleted
+        """
+        generations = self.generations()
+        for generation in generations[:-self.keep]:
+            os.remove(os.path.join(self.generations_dir, generation + ".json"))
+
+        used = set()
+        for generation in self.generations():
+            for entry in self.read_manifest(generation)['files'].values():
+                used.update(entry['chunks'])
+
+        removed = 0
+        cutoff = time.time() - UNUSED_CHUNK_GRACE
+        if os.path.isdir(self.objects_dir):
+            for prefix in os.listdir(self.objects_dir):
+                prefix_dir = os.path.join(self.objects_dir, prefix)
+                for name in os.listdir(prefix_dir):
+                    path = os.path.join(prefix_dir, name)
+                    if name not in used and os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+        return removed
+
+    def restore(self, target_dir, generation=None):
+        """Write a generation's files into a folder
+
+        Each file is rebuilt in a temporary file and renamed into place.
+        Data files in the folder that the generation does not have (a
+        journal written after the backup, for example) are removed, so the
+        folder ends up exactly as it was backed up.
+
+        Args:
+            target_dir: Data folder to restore into
+            generation: Generation name; the newest one if None
+
+        Returns:
+            The restored generation's name
+        """
+        generations = self.generations()
+        if not generations:
+            raise FileNotFoundError(f"No backups in {self.backup_dir}")
+        if generation is None:
+            generation = generations[-1]
+        files = self.read_manifest(generation)['files']
+
+        os.makedirs(target_dir, exist_ok=True)
+        for rel_path, entry in files.items():
+            path = os.path.join(target_dir, *rel_path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                for digest in entry['chunks']:
+                    with open(self._object_path(digest), 'rb') as chunk_file:
+                        data = zlib.decompress(chunk_file.read())
+                    if hashlib.sha256(data).hexdigest() != digest:
+                        raise ValueError(f"Backup chunk {digest} of {rel_path} is damaged")
+                    f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+            # A SQLite log left from before would be applied to the restored file
+            for suffix in ("-wal", "-shm", "-journal"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+        for rel_path in backup_files(target_dir):
+            if rel_path not in files:
+                os.remove(os.path.join(target_dir, *rel_path.split("/")))
+        return generation
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List or restore Trinix data backups")
+    parser.add_argument('command', choices=['list', 'restore'], help="What to do")
+    parser.add_argument('generation', nargs='?', help="Generation to restore (default: newest)")
+    parser.add_argument('--data-dir', default='data', help="Data folder (default: data)")
+    parser.add_argument('--backup-dir', help="Backup folder (default: 'backups' next to the data folder)")
+    args = parser.parse_args(argv)
+
+    backup_dir = args.backup_dir or os.environ.get('TRINIX_BACKUP_DIR') or default_backup_dir(args.data_dir)
+    store = BackupStore(backup_dir)
+
+    if args.command == 'list':
+        for generation in store.generations():
+            manifest = store.read_manifest(generation)
+            size = sum(entry['size'] for entry in manifest['files'].values())
+            print(f"{generation}  {manifest['created']}  {len(manifest['files'])} files, "
+                  f"{size / (1024 * 1024):.1f} MB")
+        return 0
+
+    try:
+        generation = store.restore(args.data_dir, args.generation)
+    except Exception as e:
+        print(f"Error restoring backup: {e}")
+        return 1
+    print(f"Restored backup {generation} into {args.data_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
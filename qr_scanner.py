@@ -0,0 +1,211 @@
+import time
+import threading
+import cv2
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QImage
+
+
+def draw_scan_overlay(frame, bbox):
+    """Draw the scanning status and a located QR code's outline onto a frame
+
+    Args:
+        frame: BGR camera frame, drawn on in place
+        bbox: Corners of the located code as a (1, 4, 2) array, or None
+    """
+    # Add a status indicator to the frame
+    cv2.putText(frame, "Scanning for QR code...", (10, 30),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 165, 255), 2)
+    if bbox is None:
+        return
+
+    try:
+        # Draw bounding box around QR code
+        corners = bbox.astype(int)[0]
+        for i in range(len(corners)):
+            cv2.line(frame, tuple(corners[i]), tuple(corners[(i + 1) % len(corners)]), (0, 255, 0), 3)
+
+        # Add text to indicate QR code is detected
+        cv2.putText(frame, "QR Code Detected", (10, 60),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+    except Exception as e:
+        # Continue without visualization if it fails
+        print(f"Error in QR detection visualization: {e}")
+
+
+class LatestFrame:
+    """
+    One-slot frame buffer between the capture and decode threads
+    A new frame replaces one the decoder has not taken yet, so the decoder
+    always works on the newest frame and never on a backlog.
+    """
+
+    def __init__(self):
+        """Initialize an empty slot"""
+        self._condition = threading.Condition()
+        self._frame = None
+        self._closed = False
+        # Frames replaced before the decoder got to them
+        self.dropped = 0
+
+    def put(self, frame):
+        """Offer a frame, replacing any frame not taken yet"""
+        with self._condition:
+            if self._frame is not None:
+                self.dropped += 1
+            self._frame = frame
+            self._condition.notify()
+
+    def take(self, timeout=None):
+        """Wait for a frame and empty the slot
+
+        Returns:
+            The newest frame, or None on timeout or once the slot is closed
+        """
+        with self._condition:
+            if self._frame is None and not self._closed:
+                self._condition.wait(timeout)
+            frame, self._frame = self._frame, None
+            return frame
+
+    def close(self):
+        """Wake up and release a waiting decoder"""
+        with self._condition:
+            self._closed = True
+            self._frame = None
+            self._condition.notify_all()
+
+
+class CameraScanner(QObject):
+    """
+    Camera preview and QR scanning off the GUI thread
+    A capture thread reads the camera and emits preview images at the
+    camera's frame rate; a decode thread scans the newest frame whenever it
+    is free. The two meet in a LatestFrame slot, so a slow decode only
+    lowers the decode rate and never the preview or the window.
+    """
+
+    # Preview image, ready for QPixmap.fromImage on the GUI thread
+    frame_ready = pyqtSignal(QImage)
+    # Decoded QR payload; scanning stops after the first one
+    code_found = pyqtSignal(str)
+    # The camera stopped delivering frames
+    camera_failed = pyqtSignal(str)
+
+    # Seconds a located code stays outlined in the preview
+    OVERLAY_SECONDS = 0.5
+    # Failed reads in a row before the camera is given up on
+    MAX_READ_FAILURES = 5
+
+    def __init__(self, camera, qr_manager, parent=None):
+        """Initialize the scanner
+
+        Args:
+            camera: Opened cv2.VideoCapture; released by the caller after stop()
+            qr_manager: QRCodeManager used for scan_frame()
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.camera = camera
+        self.qr_manager = qr_manager
+        self._slot = LatestFrame()
+        self._stop = threading.Event()
+        self._threads = []
+
+        # Last located code for the preview overlay: (bbox, time seen)
+        self._overlay_lock = threading.Lock()
+        self._overlay = (None, 0.0)
+
+        self.frames_captured = 0
+        self.frames_decoded = 0
+
+    def start(self):
+        """Start the capture and decode threads"""
+        # A region left from the previous scan would only be a wrong guess
+        self.qr_manager.reset_tracking()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="camera-capture", daemon=True),
+            threading.Thread(target=self._decode_loop, name="qr-decode", daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=2):
+        """Stop both threads and wait for them (the camera is left open)"""
+        self._stop.set()
+        self._slot.close()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+        self._threads = []
+
+    def stats(self):
+        """Frame counters, for checking the preview and decode rates and
+        how many frames the finder-pattern gate let through"""
+        gate = self.qr_manager.gate_stats()
+        return {
+            'captured': self.frames_captured,
+            'decoded': self.frames_decoded,
+            'dropped': self._slot.dropped,
+            'gate_hits': gate['hits'],
+            'gate_misses': gate['misses']
+        }
+
+    def _capture_loop(self):
+        """Capture thread: read frames, hand them to the decoder, emit previews"""
+        failures = 0
+        while not self._stop.is_set():
+            ret, frame = self.camera.read()
+            if self._stop.is_set():
+                break
+            if not ret or frame is None or frame.size == 0:
+                failures += 1
+                if failures >= self.MAX_READ_FAILURES:
+                    print("Failed to read frame from camera")
+                    self.camera_failed.emit("Failed to read frame from camera. Please try again.")
+                    break
+                time.sleep(0.03)
+                continue
+            failures = 0
+            self.frames_captured += 1
+
+            # The decoder gets the untouched frame; the preview is drawn on a copy
+            self._slot.put(frame)
+            preview = frame.copy()
+
+            with self._overlay_lock:
+                bbox, seen = self._overlay
+            if time.monotonic() - seen > self.OVERLAY_SECONDS:
+                bbox = None
+            draw_scan_overlay(preview, bbox)
+
+            try:
+                self.frame_ready.emit(self._to_qimage(preview))
+            except Exception as e:
+                print(f"Error converting frame to QImage: {e}")
+
+    def _decode_loop(self):
+        """Decode thread: scan the newest frame until a code is decoded"""
+        while not self._stop.is_set():
+            frame = self._slot.take(timeout=0.1)
+            if frame is None:
+                continue
+
+            # Consecutive frames, so the code's region is tracked
+            result = self.qr_manager.scan_frame(frame, track=True)
+            self.frames_decoded += 1
+            if result.bbox is not None:
+                with self._overlay_lock:
+                    self._overlay = (result.bbox, time.monotonic())
+
+            if result.data and not self._stop.is_set():
+                self.code_found.emit(result.data)
+                break
+
+    @staticmethod
+    def _to_qimage(frame):
+        """Convert a BGR frame to a QImage that owns its pixels"""
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        h, w, ch = rgb_frame.shape
+        bytes_per_line = ch * w
+        # copy() so the image outlives the numpy buffer it was built on
+        return QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
@@ -1,216 +1,517 @@
-import os
-import qrcode
-from PIL import Image, ImageDraw, ImageFont
-import cv2
-import numpy as np
-
-class QRCodeManager:
-    """
-    Utility class for generating and reading QR codes
-    """
-    
-    def __init__(self, qr_dir="qr_codes", logo_path=None):
-        """Initialize the QR code manager"""
-        self.qr_dir = qr_dir
-        self.logo_path = logo_path
-        
-        # Create QR codes directory if it doesn't exist
-        os.makedirs(qr_dir, exist_ok=True)
-    
-    def generate_qr_code(self, data, customer_id, customer_name=None, include_logo=True):
-        """
-        Generate a QR code with the given data
-        
-        Args:
-            data: The data to encode in the QR code
-            customer_id: The customer ID (used for filename)
-            customer_name: The customer name (used for filename)
-            include_logo: Whether to include the Trinix logo in the QR code
-            
-        Returns:
-            The path to the generated QR code image
-        """
-        # Create QR code instance
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction for logo
-            box_size=10,
-            border=4,
-        )
-        
-        # Add data to QR code
-        qr.add_data(data)
-        qr.make(fit=True)
-        
-        # Create QR code image
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert('RGBA')
-        
-        # Add logo if requested and logo path is provided
-        if include_logo and self.logo_path and os.path.exists(self.logo_path):
-            try:
-                # Open logo image
-                logo = Image.open(self.logo_path).convert('RGBA')
-                
-                # Calculate logo size (max 30% of QR code)
-                qr_width, qr_height = qr_img.size
-                logo_size = min(qr_width, qr_height) // 3
-                
-                # Resize logo
-                logo = logo.resize((logo_size, logo_size), Image.LANCZOS)
-                
-                # Calculate position to center logo
-                pos_x = (qr_width - logo_size) // 2
-                pos_y = (qr_height - logo_size) // 2
-                
-                # Create a white background for the logo
-                logo_bg = Image.new('RGBA', (logo_size, logo_size), (255, 255, 255, 255))
-                
-                # Paste logo onto QR code
-                qr_img.paste(logo_bg, (pos_x, pos_y), logo_bg)
-                qr_img.paste(logo, (pos_x, pos_y), logo)
-            except Exception as e:
-                print(f"Error adding logo to QR code: {e}")
-        
-        # Add text to QR code
-        try:
-            # Create a drawing context
-            draw = ImageDraw.Draw(qr_img)
-            
-            # Try to use a nice font, fall back to default
-            try:
-                title_font = ImageFont.truetype("arial.ttf", 20)
-                name_font = ImageFont.truetype("arial.ttf", 16)
-            except:
-                title_font = ImageFont.load_default()
-                name_font = ImageFont.load_default()
-            
-            # Add company name at the bottom
-            company_text = "Trinix Gaming"
-            company_text_width = draw.textlength(company_text, font=title_font)
-            company_text_x = (qr_img.width - company_text_width) // 2
-            company_text_y = qr_img.height - 40
-            
-            draw.text((company_text_x, company_text_y), company_text, fill="black", font=title_font)
-            
-            # Add customer name if provided
-            if customer_name:
-                # Truncate name if too long
-                if len(customer_name) > 20:
-                    display_name = customer_name[:17] + "..."
-                else:
-                    display_name = customer_name
-                    
-                name_text = f"Name: {display_name}"
-                name_text_width = draw.textlength(name_text, font=name_font)
-                name_text_x = (qr_img.width - name_text_width) // 2
-                name_text_y = qr_img.height - 20
-                
-                draw.text((name_text_x, name_text_y), name_text, fill="black", font=name_font)
-        except Exception as e:
-            print(f"Error adding text to QR code: {e}")
-        
-        # Save QR code with customer name in filename
-        if customer_name:
-            # Clean the customer name for use in a filename (remove invalid characters)
-            clean_name = ''.join(c for c in customer_name if c.isalnum() or c in ' _-').strip()
-            clean_name = clean_name.replace(' ', '_')
-            filename = f"customer_{customer_id}_{clean_name}.png"
-        else:
-            filename = f"customer_{customer_id}.png"
-            
-        qr_path = os.path.join(self.qr_dir, filename)
-        qr_img.save(qr_path)
-        
-        return qr_path
-    
-    def read_qr_code(self, image):
-        """
-        Read QR code from an image
-        
-        Args:
-            image: The image containing the QR code (numpy array from OpenCV)
-            
-        Returns:
-            The data encoded in the QR code, or None if no QR code is found
-        """
-        if image is None or image.size == 0:
-            print("Invalid image provided to QR code reader")
-            return None
-            
-        try:
-            # Create QR code detector
-            detector = cv2.QRCodeDetector()
-            
-            # Method 1: Standard OpenCV QR detection
-            data, bbox, _ = detector.detectAndDecode(image)
-            
-            if bbox is not None and data:
-                print(f"QR Code detected with standard method: {data}")
-                return data
-            
-            # Method 2: Try with ZBar if available
-            try:
-                import pyzbar.pyzbar as pyzbar
-                decoded_objects = pyzbar.decode(image)
-                
-                if decoded_objects:
-                    # Return the first decoded QR code
-                    data = decoded_objects[0].data.decode('utf-8')
-                    print(f"QR Code detected with ZBar: {data}")
-                    return data
-            except ImportError:
-                # ZBar not available, continue with other methods
-                pass
-            
-            # Method 3: Try with grayscale image
-            try:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-                data, bbox, _ = detector.detectAndDecode(gray)
-                
-                if bbox is not None and data:
-                    print(f"QR Code detected with grayscale: {data}")
-                    return data
-            except Exception as e:
-                print(f"Error in grayscale detection: {e}")
-            
-            # Method 4: Try with adaptive thresholding
-            try:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-                thresh = cv2.adaptiveThreshold(
-                    gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-                )
-                data, bbox, _ = detector.detectAndDecode(thresh)
-                
-                if bbox is not None and data:
-                    print(f"QR Code detected with adaptive threshold: {data}")
-                    return data
-            except Exception as e:
-                print(f"Error in threshold detection: {e}")
-            
-            # Method 5: Try with different thresholding
-            try:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-                _, binary = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
-                data, bbox, _ = detector.detectAndDecode(binary)
-                
-                if bbox is not None and data:
-                    print(f"QR Code detected with binary threshold: {data}")
-                    return data
-            except Exception as e:
-                print(f"Error in binary threshold detection: {e}")
-            
-            # Method 6: Try with resized image
-            try:
-                resized = cv2.resize(image, (640, 480))
-                data, bbox, _ = detector.detectAndDecode(resized)
-                
-                if bbox is not None and data:
-                    print(f"QR Code detected with resized image: {data}")
-                    return data
-            except Exception as e:
-                print(f"Error in resized detection: {e}")
-                
-        except Exception as e:
-            print(f"Error reading QR code: {e}")
-        
-        return None
\ No newline at end of file
+import os
+import qrcode
+from PIL import Image, ImageDraw, ImageFont
+import time
+import cv2
+import numpy as np
+from collections import namedtuple
+
+try:
+    import pyzbar.pyzbar as pyzbar
+except ImportError:
+    # ZBar not available, the OpenCV methods are used on their own
+    pyzbar = None
+
+# Result of QRCodeManager.scan_frame()
+ScanResult = namedtuple('ScanResult', ['data', 'bbox', 'method'])
+
+# Decode methods, in the order tried until some of them have decoded codes
+DECODE_METHODS = ('standard', 'zbar', 'adaptive_threshold', 'binary_threshold', 'resized')
+
+# Weight kept by a method's past successes each time a code is decoded
+METHOD_SCORE_DECAY = 0.9
+
+# Seconds a camera frame may spend in the decode methods
+FRAME_TIME_BUDGET = 0.06
+
+# Weight of the newest timing in a method's average cost
+METHOD_COST_SMOOTHING = 0.2
+
+# Width of the downscaled frame a tracked scan locates codes on
+LOCATE_WIDTH = 320
+
+# Margin around a tracked code, as a fraction of its size
+REGION_MARGIN = 0.5
+
+# Smallest tracked region side, in pixels
+MIN_REGION_SIZE = 48
+
+# Frames in a row without the code before its region is dropped
+REGION_MAX_MISSES = 5
+
+# Width of the frame the finder-pattern gate looks at. Half of a 640x480
+# frame keeps the gate at a few milliseconds even on grainy frames (the
+# full frame took up to 80); the cost is that a finder pattern's inner
+# ring, one module wide, blurs away on codes smaller than about 150 pixels
+# on the camera frame, so the code has to be held a little closer
+GATE_WIDTH = 320
+
+# Finder patterns the gate must see before a frame is decoded, and the
+# smallest pattern side (pixels on the gate's frame) it counts
+FINDER_MIN_PATTERNS = 2
+FINDER_MIN_SIZE = 7
+
+# scan_frame() default meaning "the manager's own time_budget"
+_MANAGER_BUDGET = object()
+
+class QRCodeManager:
+    """
+    Utility class for generating and reading QR codes
+    """
+    
+    def __init__(self, qr_dir="qr_codes", logo_path=None, time_budget=FRAME_TIME_BUDGET):
+        """Initialize the QR code manager
+        
+        Args:
+            qr_dir: Folder for generated QR codes
+            logo_path: Logo placed in the middle of generated codes
+            time_budget: Seconds scan_frame() spends on one camera frame
+        """
+        self.qr_dir = qr_dir
+        self.logo_path = logo_path
+        self.time_budget = time_budget
+        
+        # Decayed success counts per decode method - the learned order
+        self.method_scores = {method: 0.0 for method in DECODE_METHODS}
+        # Average seconds per pixel of each method, for the time budget
+        self.method_costs = {}
+        
+        # Region (x0, y0, x1, y1) of the code followed across camera frames
+        self.tracked_region = None
+        self._region_misses = 0
+        
+        # Finder-pattern gate for camera frames (see gate_stats())
+        self.gate_min_patterns = FINDER_MIN_PATTERNS
+        self.gate_hits = 0
+        self.gate_misses = 0
+        
+        # One detector for every scan - building it costs more than a
+        # decode, and the camera scans ~30 frames a second
+        self.detector = cv2.QRCodeDetector()
+        
+        # Create QR codes directory if it doesn't exist
+        os.makedirs(qr_dir, exist_ok=True)
+    
+    def generate_qr_code(self, data, customer_id, customer_name=None, include_logo=True):
+        """
+        Generate a QR code with the given data
+        
+        Args:
+            data: The data to encode in the QR code
+            customer_id: The customer ID (used for filename)
+            customer_name: The customer name (used for filename)
+            include_logo: Whether to include the Trinix logo in the QR code
+            
+        Returns:
+            The path to the generated QR code image
+        """
+        # Create QR code instance
+        qr = qrcode.QRCode(
+            version=1,
+            error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction for logo
+            box_size=10,
+            border=4,
+        )
+        
+        # Add data to QR code
+        qr.add_data(data)
+        qr.make(fit=True)
+        
+        # Create QR code image
+        qr_img = qr.make_image(fill_color="black", back_color="white").convert('RGBA')
+        
+        # Add logo if requested and logo path is provided
+        if include_logo and self.logo_path and os.path.exists(self.logo_path):
+            try:
+                # Open logo image
+                logo = Image.open(self.logo_path).convert('RGBA')
+                
+                # Calculate logo size (max 30% of QR code)
+                qr_width, qr_height = qr_img.size
+                logo_size = min(qr_width, qr_height) // 3
+                
+                # Resize logo
+                logo = logo.resize((logo_size, logo_size), Image.LANCZOS)
+                
+                # Calculate position to center logo
+                pos_x = (qr_width - logo_size) // 2
+                pos_y = (qr_height - logo_size) // 2
+                
+                # Create a white background for the logo
+                logo_bg = Image.new('RGBA', (logo_size, logo_size), (255, 255, 255, 255))
+                
+                # Paste logo onto QR code
+                qr_img.paste(logo_bg, (pos_x, pos_y), logo_bg)
+                qr_img.paste(logo, (pos_x, pos_y), logo)
+            except Exception as e:
+                print(f"Error adding logo to QR code: {e}")
+        
+        # Add text to QR code
+        try:
+            # Create a drawing context
+            draw = ImageDraw.Draw(qr_img)
+            
+            # Try to use a nice font, fall back to default
+            try:
+                title_font = ImageFont.truetype("arial.ttf", 20)
+                name_font = ImageFont.truetype("arial.ttf", 16)
+            except:
+                title_font = ImageFont.load_default()
+                name_font = ImageFont.load_default()
+            
+            # Add company name at the bottom
+            company_text = "Trinix Gaming"
+            company_text_width = draw.textlength(company_text, font=title_font)
+            company_text_x = (qr_img.width - company_text_width) // 2
+            company_text_y = qr_img.height - 40
+            
+            draw.text((company_text_x, company_text_y), company_text, fill="black", font=title_font)
+            
+            # Add customer name if provided
+            if customer_name:
+                # Truncate name if too long
+                if len(customer_name) > 20:
+                    display_name = customer_name[:17] + "..."
+                else:
+                    display_name = customer_name
+                    
+                name_text = f"Name: {display_name}"
+                name_text_width = draw.textlength(name_text, font=name_font)
+                name_text_x = (qr_img.width - name_text_width) // 2
+                name_text_y = qr_img.height - 20
+                
+                draw.text((name_text_x, name_text_y), name_text, fill="black", font=name_font)
+        except Exception as e:
+            print(f"Error adding text to QR code: {e}")
+        
+        # Save QR code with customer name in filename
+        if customer_name:
+            # Clean the customer name for use in a filename (remove invalid characters)
+            clean_name = ''.join(c for c in customer_name if c.isalnum() or c in ' _-').strip()
+            clean_name = clean_name.replace(' ', '_')
+            filename = f"customer_{customer_id}_{clean_name}.png"
+        else:
+            filename = f"customer_{customer_id}.png"
+            
+        qr_path = os.path.join(self.qr_dir, filename)
+        qr_img.save(qr_path)
+        
+        return qr_path
+    
+    def read_qr_code(self, image):
+        """
+        Read QR code from an image
+        
+        Args:
+            image: The image containing the QR code (numpy array from OpenCV)
+            
+        Returns:
+            The data encoded in the QR code, or None if no QR code is found
+        """
+        # A single image gets every method, however long they take
+        return self.scan_frame(image, time_budget=None).data
+    
+    def scan_frame(self, image, time_budget=_MANAGER_BUDGET, track=False):
+        """
+        Locate and decode a QR code in one pass over the decode methods
+        
+        Methods are tried in the learned order (see method_order()) on a
+        grayscale image computed once, until one decodes the code or the
+        time budget runs out. A method only starts if its average cost on
+        an image of this size fits in what is left of the budget, so the
+        budget holds except for the first method, which always runs (a
+        slow machine would otherwise never decode anything) and may
+        overrun it by its own cost.
+        
+        With track=True (consecutive camera frames) a frame is only decoded
+        if a quick look at a downscaled copy finds QR finder patterns (see
+        gate_stats()). The code is then located on that copy, and only the
+        region around it is decoded, at full resolution. The region follows
+        the code from frame to frame until it has been missed a few times.
+        
+        Args:
+            image: Camera frame or image (BGR or grayscale numpy array)
+            time_budget: Seconds to spend on this image, or None to try
+                every method; defaults to self.time_budget
+            track: Use and update the tracked region
+            
+        Returns:
+            ScanResult(data, bbox, method): the decoded text (None if nothing
+            could be decoded), the code's corners in image coordinates as a
+            (1, 4, 2) array (None if no code was located) and the name of
+            the method that decoded it
+        """
+        if image is None or image.size == 0:
+            print("Invalid image provided to QR code reader")
+            return ScanResult(None, None, None)
+        if time_budget is _MANAGER_BUDGET:
+            time_budget = self.time_budget
+        
+        try:
+            started = time.perf_counter()
+            # Every method works on grayscale (OpenCV's detector converts
+            # colour frames itself), so convert once for all of them
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+            
+            if not track:
+                return self._decode_region(gray, None, started, time_budget)
+            
+            region = self.tracked_region
+            if region is None:
+                # Most frames show no code at all - a cheap look for finder
+                # patterns decides whether the decode methods run
+                gate_image = self._downscale(gray, GATE_WIDTH)
+                if not self._gate(gate_image):
+                    return ScanResult(None, None, None)
+                region = self._locate(self._downscale(gate_image, LOCATE_WIDTH), gray)
+            
+            if region is None:
+                # Too small or faint to find at low resolution - try the frame
+                result = self._decode_region(gray, None, started, time_budget)
+            else:
+                result = self._decode_region(gray, region, started, time_budget)
+            self._follow(result.bbox, gray.shape)
+            return result
+                
+        except Exception as e:
+            print(f"Error reading QR code: {e}")
+        
+        return ScanResult(None, None, None)
+    
+    def _decode_region(self, gray, region, started, time_budget):
+        """Run the decode methods on a region of a grayscale frame
+        
+        Args:
+            gray: Grayscale frame
+            region: (x0, y0, x1, y1) to decode, or None for the whole frame
+            started: perf_counter() time the frame's scan started
+            time_budget: Seconds for the frame, or None for no limit
+        
+        Returns:
+            ScanResult with the corners in frame coordinates
+        """
+        offset = None
+        if region is not None:
+            x0, y0, x1, y1 = region
+            gray = gray[y0:y1, x0:x1]
+            offset = np.array([x0, y0], dtype=np.float32)
+        
+        # Corners from the first method that located a code, kept for the
+        # overlay even if no method manages to decode it
+        located = None
+        
+        for i, method in enumerate(self.method_order()):
+            if i > 0 and time_budget is not None:
+                remaining = time_budget - (time.perf_counter() - started)
+                if remaining <= 0:
+                    break
+                # Skip a method that would not finish in time; a cheaper
+                # one further down the order may still fit
+                if self.method_costs.get(method, 0.0) * gray.size > remaining:
+                    continue
+            method_started = time.perf_counter()
+            try:
+                data, bbox = getattr(self, '_decode_' + method)(gray)
+            except Exception as e:
+                print(f"Error in {method} detection: {e}")
+                continue
+            finally:
+                self._time(method, time.perf_counter() - method_started, gray.size)
+            
+            if bbox is not None and offset is not None:
+                bbox = bbox + offset
+            located = located if located is not None else bbox
+            if bbox is not None and data:
+                print(f"QR Code detected with {method}: {data}")
+                self._learn(method)
+                return ScanResult(data, bbox, method)
+        
+        return ScanResult(None, located, None)
+    
+    @staticmethod
+    def _downscale(gray, width):
+        """First pyramid level of a frame that is at most `width` wide"""
+        small = gray
+        while small.shape[1] > width:
+            small = cv2.pyrDown(small)
+        return small
+    
+    def _gate(self, small):
+        """Whether a downscaled frame may contain a QR code
+        
+        Counts finder patterns - the three nested squares in a code's
+        corners - from the contour hierarchy of a thresholded image, which
+        takes a few milliseconds on a 320x240 frame. Outcomes are counted
+        in gate_hits and gate_misses.
+        """
+        # Dark modules become foreground; a finder pattern is then a contour
+        # with a hole that has a contour inside it
+        _, binary = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+        contours, hierarchy = cv2.findContours(binary, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+        
+        patterns = 0
+        if hierarchy is not None:
+            hierarchy = hierarchy[0]
+            for i, contour in enumerate(contours):
+                child = hierarchy[i][2]
+                if child == -1 or hierarchy[child][2] == -1:
+                    continue
+                # Roughly square (at any angle) and big enough for 7x7 modules
+                (_, _), (w, h), _ = cv2.minAreaRect(contour)
+                if w < FINDER_MIN_SIZE or h < FINDER_MIN_SIZE or not 0.5 <= w / h <= 2.0:
+                    continue
+                # Filled like a square, with a 3x3 centre about a fifth of
+                # the 7x7 outline (49 / 9); noise blobs are ragged
+                area = cv2.contourArea(contour)
+                centre = cv2.contourArea(contours[hierarchy[child][2]])
+                if area < 0.6 * w * h or centre <= 0 or not 2.5 <= area / centre <= 12:
+                    continue
+                patterns += 1
+        
+        if patterns >= self.gate_min_patterns:
+            self.gate_hits += 1
+            return True
+        self.gate_misses += 1
+        return False
+    
+    def gate_stats(self):
+        """Counts of camera frames the finder-pattern gate passed and skipped
+        
+        A low hit rate while codes are held up to the camera means the gate
+        is too strict (lower gate_min_patterns); a high one with no codes in
+        view means it lets too many empty frames through.
+        """
+        checked = self.gate_hits + self.gate_misses
+        return {
+            'hits': self.gate_hits,
+            'misses': self.gate_misses,
+            'hit_rate': self.gate_hits / checked if checked else 0.0
+        }
+    
+    def _locate(self, small, gray):
+        """Find a code on the downscaled frame
+        
+        Returns:
+            Region around the code in frame coordinates, or None
+        """
+        found, points = self.detector.detect(small)
+        if not found or points is None:
+            return None
+        scale = gray.shape[1] / small.shape[1]
+        points = np.asarray(points, dtype=np.float32).reshape(1, -1, 2) * scale
+        return self._region_around(points, gray.shape)
+    
+    @staticmethod
+    def _region_around(bbox, shape):
+        """Region around a code's corners, with room for it to move"""
+        corners = bbox.reshape(-1, 2)
+        x_min, y_min = corners.min(axis=0)
+        x_max, y_max = corners.max(axis=0)
+        # Half the code's size on every side keeps the quiet zone and
+        # still contains the code after a quick move of the hand
+        margin = max(x_max - x_min, y_max - y_min, MIN_REGION_SIZE) * REGION_MARGIN
+        height, width = shape[:2]
+        x0 = int(max(0, x_min - margin))
+        y0 = int(max(0, y_min - margin))
+        x1 = int(min(width, x_max + margin))
+        y1 = int(min(height, y_max + margin))
+        if x1 - x0 < MIN_REGION_SIZE or y1 - y0 < MIN_REGION_SIZE:
+            return None
+        return (x0, y0, x1, y1)
+    
+    def _follow(self, bbox, shape):
+        """Move the tracked region to where the code was just seen"""
+        if bbox is not None:
+            self.tracked_region = self._region_around(bbox, shape)
+            self._region_misses = 0
+            return
+        
+        if self.tracked_region is not None:
+            self._region_misses += 1
+            if self._region_misses >= REGION_MAX_MISSES:
+                # Lost - the next frame searches the whole (downscaled) frame
+                self.reset_tracking()
+    
+    def reset_tracking(self):
+        """Forget the tracked region, e.g. when a new scan starts"""
+        self.tracked_region = None
+        self._region_misses = 0
+    
+    def method_order(self):
+        """Decode methods in the order they are tried
+        
+        Methods that recently decoded codes under this camera and lighting
+        come first; ties keep the order of DECODE_METHODS.
+        """
+        methods = [method for method in DECODE_METHODS if method != 'zbar' or pyzbar is not None]
+        return sorted(methods, key=lambda method: -self.method_scores[method])
+    
+    def _learn(self, method):
+        """Move a method that decoded a code up the order"""
+        # Older successes fade, so the order follows changes in lighting
+        for name in self.method_scores:
+            self.method_scores[name] *= METHOD_SCORE_DECAY
+        self.method_scores[method] += 1.0
+    
+    def _time(self, method, seconds, pixels):
+        """Fold one run's duration into a method's average cost per pixel"""
+        cost = seconds / max(pixels, 1)
+        previous = self.method_costs.get(method)
+        if previous is None:
+            self.method_costs[method] = cost
+        else:
+            self.method_costs[method] = previous + METHOD_COST_SMOOTHING * (cost - previous)
+    
+    def _decode_standard(self, gray):
+        """Method 1: Standard OpenCV QR detection"""
+        return self._detect_and_decode(gray)
+    
+    def _decode_zbar(self, gray):
+        """Method 2: ZBar, if installed"""
+        decoded_objects = pyzbar.decode(gray)
+        if not decoded_objects:
+            return None, None
+        # Return the first decoded QR code
+        return decoded_objects[0].data.decode('utf-8'), self._zbar_bbox(decoded_objects[0])
+    
+    def _decode_adaptive_threshold(self, gray):
+        """Method 3: Adaptive thresholding, for uneven light"""
+        thresh = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+        )
+        return self._detect_and_decode(thresh)
+    
+    def _decode_binary_threshold(self, gray):
+        """Method 4: Fixed binary threshold"""
+        _, binary = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
+        return self._detect_and_decode(binary)
+    
+    def _decode_resized(self, gray):
+        """Method 5: Resized to 640x480 (same as standard for camera frames)"""
+        height, width = gray.shape[:2]
+        if (width, height) == (640, 480):
+            return None, None
+        data, bbox = self._detect_and_decode(cv2.resize(gray, (640, 480)))
+        if bbox is not None:
+            # Corners back in the original image's coordinates
+            bbox = bbox * np.array([width / 640, height / 480], dtype=np.float32)
+        return data, bbox
+    
+    def _detect_and_decode(self, image):
+        """Run the shared detector on one image
+        
+        Returns:
+            (data, bbox) with bbox as a (1, 4, 2) float array, or None
+        """
+        data, bbox, _ = self.detector.detectAndDecode(image)
+        if bbox is not None:
+            bbox = np.asarray(bbox, dtype=np.float32).reshape(1, -1, 2)
+        return data, bbox
+    
+    @staticmethod
+    def _zbar_bbox(decoded):
+        """Corners of a ZBar result in the same layout as OpenCV's"""
+        points = [(point.x, point.y) for point in decoded.polygon]
+        if len(points) < 4:
+            return None
+        return np.array([points[:4]], dtype=np.float32)
@@ -0,0 +1,657 @@
+import os
+import sqlite3
+import pandas as pd
+from datetime import datetime
+from database_manager import (DatabaseManager, CUSTOMER_SCHEMA, VISIT_COLUMNS,
+                              append_rows, visits_with_date_columns)
+from visit_partitions import UNDATED
+from change_events import ChangeEvent, CUSTOMER_ADDED, CUSTOMER_UPDATED, CUSTOMER_DELETED, VISIT_ADDED
+
+# Column order shared by the tables and the dataframes
+CUSTOMER_COLUMNS = list(CUSTOMER_SCHEMA)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS customers (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    phone TEXT,
+    age_group TEXT,
+    location TEXT,
+    occupation TEXT,
+    qr_code_path TEXT,
+    registration_date TEXT,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_customers_phone ON customers (phone);
+
+CREATE TABLE IF NOT EXISTS visits (
+    visit_id INTEGER PRIMARY KEY,
+    customer_id INTEGER,
+    date TEXT,
+    time TEXT,
+    game_genre TEXT,
+    console TEXT,
+    payment_method TEXT,
+    payment_amount REAL,
+    snacks_amount REAL,
+    snacks_details TEXT,
+    referrals INTEGER,
+    points INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_visits_date ON visits (date);
+CREATE INDEX IF NOT EXISTS idx_visits_customer ON visits (customer_id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+-- One row per committed write, in commit order, so other terminals can
+-- pull just the rows that changed
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT,
+    row_id INTEGER
+);
+
+-- ID counters shared by every terminal
+CREATE TABLE IF NOT EXISTS sequences (
+    name TEXT PRIMARY KEY,
+    value INTEGER
+);
+"""
+
+# Changes kept for terminals that are behind; older ones are pruned on open
+CHANGES_KEPT = 100000
+
+# Table and column each shared ID counter is kept ahead of
+SEQUENCE_COLUMNS = {
+    'customer_id': ('customers', 'id'),
+    'visit_id': ('visits', 'visit_id'),
+}
+
+# Statements are kept as constants so sqlite3 reuses its prepared statements
+INSERT_CUSTOMER_SQL = (
+    "INSERT INTO customers (" + ", ".join(CUSTOMER_COLUMNS) + ") "
+    "VALUES (" + ", ".join("?" * len(CUSTOMER_COLUMNS)) + ")"
+)
+INSERT_VISIT_SQL = (
+    "INSERT INTO visits (" + ", ".join(VISIT_COLUMNS) + ") "
+    "VALUES (" + ", ".join("?" * len(VISIT_COLUMNS)) + ")"
+)
+UPSERT_VISIT_SQL = INSERT_VISIT_SQL.replace("INSERT", "INSERT OR REPLACE", 1)
+UPDATE_CUSTOMER_SQL = (
+    "UPDATE customers SET " + ", ".join(f"{col} = ?" for col in CUSTOMER_COLUMNS[1:]) +
+    ", version = version + 1 WHERE id = ? AND version = ?"
+)
+DELETE_CUSTOMER_SQL = "DELETE FROM customers WHERE id = ?"
+SELECT_VISITS_BY_DATE_SQL = (
+    "SELECT " + ", ".join(VISIT_COLUMNS) + " FROM visits "
+    "WHERE date >= ? AND date <= ? ORDER BY visit_id"
+)
+SELECT_VISITS_BY_MONTH_SQL = (
+    "SELECT " + ", ".join(VISIT_COLUMNS) + " FROM visits "
+    "WHERE date >= ? AND date < ? ORDER BY visit_id"
+)
+SELECT_UNDATED_VISITS_SQL = (
+    "SELECT " + ", ".join(VISIT_COLUMNS) + " FROM visits "
+    "WHERE date IS NULL OR date NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]*' ORDER BY visit_id"
+)
+# Months with visits, read from the date index without touching the rows
+SELECT_VISIT_MONTHS_SQL = "SELECT DISTINCT substr(date, 1, 7) FROM visits"
+SELECT_VISITS_BY_CUSTOMER_SQL = (
+    "SELECT " + ", ".join(VISIT_COLUMNS) + " FROM visits "
+    "WHERE customer_id = ? ORDER BY visit_id"
+)
+UPDATE_VISIT_POINTS_SQL = "UPDATE visits SET points = ? WHERE visit_id = ?"
+INSERT_CHANGE_SQL = "INSERT INTO changes (kind, row_id) VALUES (?, ?)"
+SELECT_CHANGES_SQL = "SELECT seq, kind, row_id FROM changes WHERE seq > ? ORDER BY seq"
+
+
+def date_month(date):
+    """Partition key of a visit's 'YYYY-MM-DD' date text (UNDATED if it has none)"""
+    prefix = date[:7] if isinstance(date, str) else None
+    is_month = prefix is not None and len(prefix) == 7 and prefix[4] == '-' and prefix.replace('-', '').isdigit()
+    return prefix if is_month else UNDATED
+
+
+class StaleCustomerError(Exception):
+    """A customer was changed on another terminal since it was read
+
+    Carries the change events of reloading the customer; they are
+    published once the manager's lock is released
+    """
+
+    def __init__(self, message, events=()):
+        super().__init__(message)
+        self.events = list(events)
+
+
+class SQLiteDatabaseManager(DatabaseManager):
+    """
+    SQLite storage engine for Trinix Gaming Shop
+    Same public API as DatabaseManager, but every write touches a single
+    indexed row instead of rewriting the CSV files. Several terminals can
+    share one database: writes are short transactions, IDs come from shared
+    counters, customer updates are checked against a row version, and
+    refresh() pulls in what the other terminals changed.
+    """
+
+    def __init__(self, data_dir="data", db_name="trinix.db", journal_mode="WAL", busy_timeout=10,
+                 resident_months=None):
+        """Open (or create) the SQLite database and load it into memory
+
+        Args:
+            data_dir: Directory holding the database
+            db_name: Database file name
+            journal_mode: SQLite journal mode. WAL lets readers and a writer
+                work at the same time; use 'DELETE' when the data folder is on
+                a network share, where WAL is not supported
+            busy_timeout: Seconds to wait for another terminal's write to finish
+            resident_months: Months of visits kept in memory, see DatabaseManager
+        """
+        os.makedirs(data_dir, exist_ok=True)
+        self.db_path = os.path.join(data_dir, db_name)
+        self.busy_timeout = busy_timeout
+
+        # check_same_thread=False so background helpers can share the connection
+        self.conn = sqlite3.connect(self.db_path, timeout=busy_timeout, check_same_thread=False)
+        self.conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        self.conn.execute("PRAGMA synchronous=NORMAL" if journal_mode.upper() == "WAL" else "PRAGMA synchronous=FULL")
+        self.conn.executescript(SCHEMA)
+        self._upgrade_schema()
+        self.conn.commit()
+
+        # Row versions for optimistic update checks (id -> version)
+        self._versions = {}
+        # Last change seen from the changes table, and SQLite's counter of
+        # commits made by other connections
+        self._change_seq = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+        self._data_version = self._read_data_version()
+
+        # Loads the dataframes through the overridden _load_* methods; the
+        # database is already binary, so no CSV snapshots are kept
+        super().__init__(data_dir, use_snapshots=False, resident_months=resident_months)
+
+    def _upgrade_schema(self):
+        """Add columns missing from databases created by older versions"""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(customers)")]
+        if 'version' not in columns:
+            self.conn.execute("ALTER TABLE customers ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+        # Keep the change log short
+        with self.conn:
+            self.conn.execute("DELETE FROM changes WHERE seq <= (SELECT MAX(seq) FROM changes) - ?",
+                              (CHANGES_KEPT,))
+
+    def _read_data_version(self):
+        """SQLite's counter that moves when another connection commits"""
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        self._wait_for_backup()
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    # Online backups
+    def _backup_engine(self):
+        """Name of the storage engine recorded with each backup"""
+        return "sqlite"
+
+    def _backup_sources(self):
+        """Data files a backup covers, apart from the database itself"""
+        db_name = os.path.relpath(self.db_path, self.data_dir).replace(os.sep, "/")
+        return [rel_path for rel_path in super()._backup_sources() if rel_path != db_name]
+
+    def _capture_backup(self, staging_dir, stored_stamps):
+        """Stage the other data files and a consistent copy of the database
+
+        SQLite's backup API copies the database from one read transaction on
+        a connection of its own; in WAL mode that never blocks this or any
+        other terminal's writes.
+        """
+        files = super()._capture_backup(staging_dir, stored_stamps)
+
+        db_name = os.path.relpath(self.db_path, self.data_dir).replace(os.sep, "/")
+        staged = os.path.join(staging_dir, db_name)
+        os.makedirs(os.path.dirname(staged), exist_ok=True)
+        source = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+        try:
+            target = sqlite3.connect(staged)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+        finally:
+            source.close()
+        files[db_name] = (staged, None, None)
+        return files
+
+    # Loading and one-time CSV migration
+    def _load_customers(self):
+        """Load customers from SQLite, migrating customers.csv on first run"""
+        self._migrate_csv('customers_migrated', self.customers_file, os.path.exists(self.customers_file),
+                          super()._load_customers, CUSTOMER_COLUMNS, INSERT_CUSTOMER_SQL)
+        df = pd.read_sql_query(
+            "SELECT " + ", ".join(CUSTOMER_COLUMNS) + ", version FROM customers ORDER BY id",
+            self.conn
+        )
+        self._versions = dict(zip(df['id'].astype(int).tolist(), df['version'].astype(int).tolist()))
+        return self._prepare_customers(df.drop(columns=['version']))
+
+    def _migrate_visit_files(self):
+        """Copy the CSV visit files into the visits table on first run"""
+        # Either the monthly files in data/visits or the older single visits.csv
+        stored_months = self._stored_visit_months()
+        csv_source = self.visits_dir if stored_months else self.visits_file
+        self._migrate_csv('visits_migrated', csv_source, os.path.exists(csv_source),
+                          super()._load_visits, VISIT_COLUMNS, INSERT_VISIT_SQL)
+
+    def _load_visits(self):
+        """Load visits from SQLite, migrating the CSV visit files on first run"""
+        self._migrate_visit_files()
+        return self._prepare_visits(pd.read_sql_query(
+            "SELECT " + ", ".join(VISIT_COLUMNS) + " FROM visits ORDER BY visit_id",
+            self.conn
+        ))
+
+    @staticmethod
+    def _visit_month_query(month):
+        """(sql, params) selecting one month of visits through the date index"""
+        if month == UNDATED:
+            return SELECT_UNDATED_VISITS_SQL, ()
+        # '~' sorts after every character of a 'YYYY-MM-DD' date
+        return SELECT_VISITS_BY_MONTH_SQL, (month, month + '~')
+
+    def _load_visit_month(self, month):
+        """Load one month of visits through the date index"""
+        sql, params = self._visit_month_query(month)
+        return self._prepare_visits(pd.read_sql_query(sql, self.conn, params=params))
+
+    def _open_visits(self):
+        """Register the months in the visits table and load the current one
+
+        Older months are read through the date index when a query needs them
+        """
+        self._migrate_visit_files()
+
+        months = {date_month(prefix) for (prefix,) in self.conn.execute(SELECT_VISIT_MONTHS_SQL)}
+        self._visit_partitions.register(months)
+
+        current_month = datetime.now().strftime('%Y-%m')
+        if current_month in months:
+            self._visit_partitions.frame(current_month)
+
+        self._last_visit_id = self.conn.execute("SELECT COALESCE(MAX(visit_id), 0) FROM visits").fetchone()[0]
+        self._dirty_visit_months = set()
+
+    def _migrate_csv(self, flag, csv_source, csv_exists, csv_loader, columns, insert_sql):
+        """Copy existing CSV data into its table exactly once"""
+        if self._get_meta(flag) is not None:
+            return
+
+        if csv_exists:
+            df = csv_loader()
+            if 'visited_at' in df.columns:
+                # Tables keep the CSV 'date' and 'time' columns
+                df = visits_with_date_columns(df)
+
+            # Make sure every column exists before inserting
+            for col in columns:
+                if col not in df.columns:
+                    df[col] = ''
+
+            rows = [self._to_row(record, columns) for record in df[columns].to_dict('records')]
+            with self.conn:
+                self.conn.executemany(insert_sql, rows)
+            print(f"Migrated {len(rows)} rows from {csv_source} to {self.db_path}")
+
+        self._set_meta(flag, '1')
+
+    def _get_meta(self, key):
+        """Read a value from the meta table"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        """Write a value to the meta table"""
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @staticmethod
+    def _to_row(record, columns):
+        """Convert a dict into a parameter tuple with plain Python values"""
+        row = []
+        for col in columns:
+            value = record.get(col)
+            if pd.isna(value):
+                value = None
+            elif hasattr(value, 'item'):
+                # numpy scalar -> Python scalar
+                value = value.item()
+            row.append(value)
+        return tuple(row)
+
+    # Persistence hooks - one statement per change, logged in the same
+    # transaction so other terminals see it on their next refresh()
+    def _log_change(self, kind, row_id):
+        """Record a write in the changes table (inside the open transaction)"""
+        seq = self.conn.execute(INSERT_CHANGE_SQL, (kind, int(row_id))).lastrowid
+        # Nothing from another terminal came in between, so skip our own change
+        if seq == self._change_seq + 1:
+            self._change_seq = seq
+
+    def _persist_customer_insert(self, customer):
+        """Insert a single customer row"""
+        with self.conn:
+            self.conn.execute(INSERT_CUSTOMER_SQL, self._to_row(customer, CUSTOMER_COLUMNS))
+            self._log_change('customer', customer['id'])
+        self._versions[int(customer['id'])] = 0
+
+    def _persist_customer_update(self, customer_id, changes):
+        """Update only the changed customer fields if nobody else has
+
+        The row version must still be the one this terminal loaded; if
+        another terminal got there first the local copy is reloaded and
+        StaleCustomerError is raised
+        """
+        columns = [col for col in changes if col in CUSTOMER_COLUMNS and col != 'id']
+        if not columns:
+            return
+
+        customer_id = int(customer_id)
+        version = self._versions.get(customer_id, 0)
+        sql = ("UPDATE customers SET " + ", ".join(f"{col} = ?" for col in columns) +
+               ", version = version + 1 WHERE id = ? AND version = ?")
+        params = self._to_row(changes, columns) + (customer_id, version)
+        with self.conn:
+            updated = self.conn.execute(sql, params).rowcount
+            if updated:
+                self._log_change('customer', customer_id)
+
+        if not updated:
+            # Undo the in-memory edit with the other terminal's version
+            events = self._reload_customers([customer_id])
+            raise StaleCustomerError(f"customer {customer_id} was changed on another terminal", events)
+        self._versions[customer_id] = version + 1
+
+    def _persist_customer_delete(self, customer_id):
+        """Delete a single customer row"""
+        with self.conn:
+            self.conn.execute(DELETE_CUSTOMER_SQL, (int(customer_id),))
+            self._log_change('customer', customer_id)
+        self._versions.pop(int(customer_id), None)
+
+    def _persist_visit_insert(self, visit):
+        """Insert a single visit row"""
+        with self.conn:
+            self.conn.execute(INSERT_VISIT_SQL, self._to_row(visit, VISIT_COLUMNS))
+            self._log_change('visit', visit['visit_id'])
+        self._visit_months_committed({date_month(visit['date'])})
+
+    def _persist_visit_points(self, month, visits):
+        """Update the points of one month's re-scored visits
+
+        Runs inside the transaction recompute_points() holds open, so the
+        month can be unloaded as soon as the scan moves on
+        """
+        self.conn.executemany(UPDATE_VISIT_POINTS_SQL, zip(
+            visits['points'].astype(int).tolist(), visits['visit_id'].astype(int).tolist()))
+
+    def _persist_customers_bulk(self, customers):
+        """Insert many customer rows in one transaction"""
+        with self.conn:
+            self.conn.executemany(INSERT_CUSTOMER_SQL,
+                                  [self._to_row(customer, CUSTOMER_COLUMNS) for customer in customers])
+            for customer in customers:
+                self._log_change('customer', customer['id'])
+        for customer in customers:
+            self._versions[int(customer['id'])] = 0
+
+    def _persist_visits_bulk(self, visits):
+        """Insert many visit rows in one transaction"""
+        with self.conn:
+            self.conn.executemany(INSERT_VISIT_SQL, [self._to_row(visit, VISIT_COLUMNS) for visit in visits])
+            for visit in visits:
+                self._log_change('visit', visit['visit_id'])
+        self._visit_months_committed({date_month(visit['date']) for visit in visits})
+
+    def _visit_months_committed(self, months):
+        """Clear the changed mark of months whose rows are now in the table
+
+        The CSV engine keeps changed months loaded until save_visits()
+        writes them; here each change is committed as it is made, so cold
+        months can be unloaded again straight away
+        """
+        with self._lock:
+            self._dirty_visit_months.difference_update(months)
+            self._trim_resident_visits()
+
+    def _sync_sequences(self):
+        """Start (or move) the shared counters past the IDs in the tables"""
+        with self.conn:
+            for name, (table, column) in SEQUENCE_COLUMNS.items():
+                self.conn.execute(
+                    f"INSERT OR IGNORE INTO sequences (name, value) "
+                    f"SELECT ?, COALESCE(MAX({column}), 0) FROM {table}", (name,))
+                self.conn.execute(
+                    f"UPDATE sequences SET value = MAX(value, (SELECT COALESCE(MAX({column}), 0) FROM {table})) "
+                    f"WHERE name = ?", (name,))
+
+    def reserve_ids(self, name, count=1):
+        """Reserve a block of consecutive IDs from a shared counter
+
+        The update runs in its own short write transaction, so two
+        terminals never get the same ID
+        """
+        count = max(int(count), 1)
+        with self.conn:
+            self.conn.execute("UPDATE sequences SET value = value + ? WHERE name = ?", (count, name))
+            last = self.conn.execute("SELECT value FROM sequences WHERE name = ?", (name,)).fetchone()[0]
+        return range(last - count + 1, last + 1)
+
+    def customer_version(self, customer_id):
+        """Version of a customer row as last read by this terminal"""
+        try:
+            return self._versions.get(int(customer_id))
+        except (ValueError, TypeError):
+            return None
+
+    # Incremental refresh from other terminals
+    def refresh(self):
+        """Pull in rows that other terminals have changed
+
+        Cheap when nothing changed: one PRAGMA read. Otherwise only the
+        changed customers and new visits are read.
+
+        Returns:
+            Dictionary with the number of 'customers' and 'visits' refreshed
+        """
+        counts = {'customers': 0, 'visits': 0}
+        data_version = self._read_data_version()
+        if data_version == self._data_version:
+            return counts
+        self._data_version = data_version
+
+        changes = self.conn.execute(SELECT_CHANGES_SQL, (self._change_seq,)).fetchall()
+        if not changes:
+            return counts
+        self._change_seq = changes[-1][0]
+
+        customer_ids = {row_id for _, kind, row_id in changes if kind == 'customer'}
+        visit_ids = [row_id for _, kind, row_id in changes if kind == 'visit']
+
+        if customer_ids:
+            events = self._reload_customers(customer_ids)
+            counts['customers'] = len(events)
+            self.events.publish(events)
+        if visit_ids:
+            with self._lock:
+                added = self._merge_visits(self._read_visits_by_id(visit_ids))
+                self._trim_resident_visits()
+            events = []
+            for part in added.values():
+                for record in visits_with_date_columns(part).to_dict('records'):
+                    events.append(ChangeEvent(VISIT_ADDED, record['visit_id'], record, remote=True))
+            counts['visits'] = len(events)
+            self.events.publish(events)
+        return counts
+
+    def _read_rows_by_id(self, sql, ids):
+        """Run a 'WHERE id IN (...)' query in chunks SQLite accepts"""
+        ids = [int(row_id) for row_id in ids]
+        frames = []
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            frames.append(pd.read_sql_query(sql.format(", ".join("?" * len(chunk))), self.conn, params=chunk))
+        return pd.concat(frames, ignore_index=True)
+
+    def _read_visits_by_id(self, visit_ids):
+        """Typed visits with the given IDs"""
+        return self._prepare_visits(self._read_rows_by_id(
+            "SELECT " + ", ".join(VISIT_COLUMNS) + " FROM visits WHERE visit_id IN ({})", visit_ids))
+
+    def _reload_customers(self, customer_ids):
+        """Replace the in-memory copy of some customers with the database rows
+
+        Returns:
+            A remote change event for every customer reloaded (including
+            removed ones), for the caller to publish once it holds no lock
+        """
+        df = self._read_rows_by_id(
+            "SELECT " + ", ".join(CUSTOMER_COLUMNS) + ", version FROM customers WHERE id IN ({})", customer_ids)
+        versions = dict(zip(df['id'].astype(int).tolist(), df['version'].astype(int).tolist()))
+        fresh = self._prepare_customers(df.drop(columns=['version']))
+
+        events = []
+        with self._lock:
+            added = []
+            for record in fresh.to_dict('records'):
+                customer_id = int(record['id'])
+                self._versions[customer_id] = versions[customer_id]
+                position = self._id_index.get(customer_id)
+                if position is None:
+                    added.append(record)
+                    events.append(ChangeEvent(CUSTOMER_ADDED, customer_id, record, remote=True))
+                    continue
+                events.append(ChangeEvent(CUSTOMER_UPDATED, customer_id, record, remote=True))
+
+                for key, value in record.items():
+                    if isinstance(self._customers_df[key].dtype, pd.CategoricalDtype) \
+                            and value not in self._customers_df[key].cat.categories:
+                        self._customers_df[key] = self._customers_df[key].cat.add_categories([value])
+                    self._customers_df.at[position, key] = value
+                self._phone_index.remove(customer_id)
+                self._phone_index.add(customer_id, record['phone'])
+                self._name_index.remove(customer_id)
+                self._name_index.add(customer_id, record['name'])
+
+            if added:
+                first_position = len(self._customers_df)
+                self._customers_df = append_rows(self._customers_df, pd.DataFrame(added), CUSTOMER_SCHEMA)
+                for offset, record in enumerate(added):
+                    customer_id = int(record['id'])
+                    self._id_index.setdefault(customer_id, first_position + offset)
+                    self._phone_index.add(customer_id, record['phone'])
+                    self._name_index.add(customer_id, record['name'])
+
+            removed = [int(customer_id) for customer_id in customer_ids
+                       if int(customer_id) not in versions and int(customer_id) in self._id_index]
+            if removed:
+                positions = [self._id_index[customer_id] for customer_id in removed]
+                for customer_id, position in zip(removed, positions):
+                    events.append(ChangeEvent(CUSTOMER_DELETED, customer_id,
+                                              self._customers_df.iloc[position].to_dict(), remote=True))
+                self._customers_df = self._customers_df.drop(index=positions).reset_index(drop=True)
+                self._rebuild_customer_index()
+                for customer_id in removed:
+                    self._versions.pop(customer_id, None)
+                    self._phone_index.remove(customer_id)
+                    self._name_index.remove(customer_id)
+
+        return events
+
+    def save_customers(self, df=None):
+        """Write the customers that differ from their rows in the table
+
+        Bulk path, prefer update_customer. A changed row is only written if
+        no other terminal has changed it since it was loaded; its version
+        goes up and the change is logged, as in update_customer. Rows
+        changed or deleted elsewhere are reloaded instead. Rows missing
+        from the dataframe are left alone (they may be another terminal's
+        new customers) - remove customers with delete_customer().
+        """
+        if df is not None:
+            self.customers_df = self._prepare_customers(df)
+
+        stale = []
+        with self._lock:
+            rows = [self._to_row(record, CUSTOMER_COLUMNS)
+                    for record in self._customers_df.reindex(columns=CUSTOMER_COLUMNS).to_dict('records')]
+            stored = {row[0]: row for row in self.conn.execute(
+                "SELECT " + ", ".join(CUSTOMER_COLUMNS) + " FROM customers")}
+            versions = {}
+            with self.conn:
+                for row in rows:
+                    customer_id = row[0]
+                    if stored.get(customer_id) == row:
+                        continue
+                    if customer_id not in stored and customer_id not in self._versions:
+                        self.conn.execute(INSERT_CUSTOMER_SQL, row)
+                        versions[customer_id] = 0
+                    else:
+                        version = self._versions.get(customer_id, 0)
+                        if not self.conn.execute(UPDATE_CUSTOMER_SQL, row[1:] + (customer_id, version)).rowcount:
+                            stale.append(customer_id)
+                            continue
+                        versions[customer_id] = version + 1
+                    self._log_change('customer', customer_id)
+            self._versions.update(versions)
+
+        if stale:
+            print(f"{len(stale)} customers were changed on another terminal and were reloaded, not saved")
+            self.events.publish(self._reload_customers(stale))
+
+    def save_visits(self):
+        """Write the visits changed in memory since they were loaded
+
+        Bulk path, prefer add_visit. Only the months replaced through
+        visits_df are compared with the table; rows that differ or are
+        missing are written and logged for the other terminals. Rows the
+        dataframe does not have are kept, as they may be another
+        terminal's new check-ins.
+        """
+        with self._lock:
+            months = sorted(self._dirty_visit_months)
+            self._fold_pending_visits(months)
+            with self.conn:
+                for month in months:
+                    records = visits_with_date_columns(self._visit_partitions.frame(month))[VISIT_COLUMNS]
+                    for column in ('payment_amount', 'snacks_amount'):
+                        records[column] = records[column].astype('float64').round(2)
+                    sql, params = self._visit_month_query(month)
+                    stored = {row[0]: row for row in self.conn.execute(sql, params)}
+                    for record in records.to_dict('records'):
+                        row = self._to_row(record, VISIT_COLUMNS)
+                        if stored.get(row[0]) != row:
+                            self.conn.execute(UPSERT_VISIT_SQL, row)
+                            self._log_change('visit', row[0])
+            self._visit_months_committed(months)
+
+    def recompute_points(self):
+        """Re-score every visit and write the new points in one transaction"""
+        with self._lock, self.conn:
+            return super().recompute_points()
+
+    # Queries answered from the indexes
+    def _visits_for_customer(self, customer_id):
+        """Typed visits of one customer, read through the customer index"""
+        return self._prepare_visits(pd.read_sql_query(
+            SELECT_VISITS_BY_CUSTOMER_SQL, self.conn, params=(int(customer_id),)))
+
+    def _visits_in_range(self, start_date, end_date):
+        """Typed visits between two dates, read through the date index"""
+        return self._prepare_visits(pd.read_sql_query(
+            SELECT_VISITS_BY_DATE_SQL, self.conn, params=(str(start_date), str(end_date))))
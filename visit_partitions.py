@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+
+# Partition key for visits whose date could not be parsed
+UNDATED = 'undated'
+
+
+def month_key(timestamp):
+    """Partition key ('YYYY-MM') of a single visit time"""
+    if pd.isna(timestamp):
+        return UNDATED
+    return timestamp.strftime('%Y-%m')
+
+
+def month_keys(visited_at):
+    """Partition keys of a datetime64 column"""
+    return visited_at.dt.strftime('%Y-%m').fillna(UNDATED)
+
+
+def months_overlapping(months, start, end):
+    """Months that can hold visits in [start, end)
+
+    Args:
+        months: Known partition keys
+        start: First timestamp of the range
+        end: Timestamp just after the range
+
+    Returns:
+        The overlapping keys in chronological order
+    """
+    first = start.strftime('%Y-%m')
+    last = (end - pd.Timedelta(1)).strftime('%Y-%m')
+    return sorted(month for month in months if month != UNDATED and first <= month <= last)
+
+
+def concat_frames(frames, empty):
+    """Concatenate typed partitions, keeping categorical columns categorical
+
+    Args:
+        frames: Typed dataframes with the same columns
+        empty: Typed dataframe with no rows, returned when nothing is left
+    """
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return empty.copy()
+    if len(frames) == 1:
+        return frames[0]
+
+    frames = [frame.copy() for frame in frames]
+    for col in frames[0].columns:
+        if not isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            continue
+        categories = frames[0][col].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[col].cat.categories)
+        # Same categories everywhere, so concat keeps the column categorical
+        for frame in frames:
+            frame[col] = frame[col].cat.set_categories(categories)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def sort_by_time(df):
+    """Order visits by 'visited_at' (stable, so equal times keep their order)"""
+    if 'visited_at' not in df.columns or df['visited_at'].is_monotonic_increasing:
+        return df
+    return df.sort_values('visited_at', kind='stable', na_position='last').reset_index(drop=True)
+
+
+class VisitPartitions:
+    """
+    Visits held in memory as one dataframe per calendar month
+    Months that exist on disk are registered up front but only read the
+    first time a query needs them. Every month is kept sorted by
+    'visited_at', so date ranges are found by binary search.
+    """
+
+    def __init__(self, load_month, empty, cache_combined=True):
+        """Initialize the partition set
+
+        Args:
+            load_month: Callable returning the typed dataframe of one month
+            empty: Typed dataframe with no rows
+            cache_combined: Keep the all-months dataframe between calls;
+                turn off when months are unloaded to bound memory
+        """
+        self._load_month = load_month
+        self.empty = empty
+        self.cache_combined = cache_combined
+        self.months = set()
+        self._frames = {}
+        self._combined = None
+
+    def register(self, months):
+        """Record months that exist in storage without loading them"""
+        for month in months:
+            if month not in self.months:
+                self.months.add(month)
+                self._combined = None
+
+    def is_loaded(self, month):
+        """Check whether a month is already in memory"""
+        return month in self._frames
+
+    def loaded_months(self):
+        """Months currently held in memory"""
+        return sorted(self._frames)
+
+    def frame(self, month):
+        """The dataframe of one month, loading it on first use"""
+        if month not in self._frames:
+            if month in self.months:
+                self._frames[month] = sort_by_time(self._load_month(month))
+            else:
+                self._frames[month] = self.empty.copy()
+                self.months.add(month)
+        return self._frames[month]
+
+    def unload(self, month):
+        """Drop a month from memory; it is loaded again on next use"""
+        if self._frames.pop(month, None) is not None:
+            self._combined = None
+
+    def set_frame(self, month, df):
+        """Replace the dataframe of one month"""
+        self.months.add(month)
+        self._frames[month] = sort_by_time(df.reset_index(drop=True))
+        self._combined = None
+
+    def replace_all(self, df):
+        """Replace every partition with the rows of a single dataframe"""
+        self.months = set()
+        self._frames = {}
+        self._combined = None
+        if 'visited_at' in df.columns and len(df):
+            for month, part in df.groupby(month_keys(df['visited_at']), sort=True):
+                self.set_frame(month, part)
+
+    def combined(self, months=None):
+        """Rows of the given months (all months if None) as one dataframe"""
+        if months is not None:
+            return concat_frames([self.frame(month) for month in sorted(months)], self.empty)
+
+        # Every month is needed; the result is cached until a partition changes
+        if self._combined is not None:
+            return self._combined
+        ordered = sorted(self.months, key=lambda month: (month == UNDATED, month))
+        combined = concat_frames([self.frame(month) for month in ordered], self.empty)
+        if self.cache_combined:
+            self._combined = combined
+        return combined
+
+    def time_range(self, months, start, end):
+        """Visits with start <= visited_at < end
+
+        Each month is searched with searchsorted on its datetime64 column,
+        so the cost is O(log n) per month plus the rows returned. A range
+        inside a single month is returned as a slice of that month.
+
+        Args:
+            months: Months overlapping the range (see months_overlapping)
+            start: First timestamp of the range
+            end: Timestamp just after the range
+        """
+        start = np.datetime64(pd.Timestamp(start).to_datetime64(), 'ns')
+        end = np.datetime64(pd.Timestamp(end).to_datetime64(), 'ns')
+
+        parts = []
+        for month in sorted(months):
+            frame = self.frame(month)
+            keys = frame['visited_at'].to_numpy()
+            first = keys.searchsorted(start, side='left')
+            last = keys.searchsorted(end, side='left')
+            parts.append(frame.iloc[first:last])
+        return concat_frames(parts, self.empty)
@@ -0,0 +1,106 @@
+import threading
+
+
+class GroupCommitWriter:
+    """
+    Background thread that batches writes for the database manager
+    Callers queue journal records and mark files as dirty; the thread
+    commits everything queued in one pass every `interval` seconds, so ten
+    quick check-ins cost one fsync and a customer file that changed five
+    times is written once. flush() blocks until every write queued before
+    the call is on disk.
+    """
+
+    def __init__(self, commit, interval=0.25, name="group-commit-writer"):
+        """Start the writer thread
+
+        Args:
+            commit: Callable taking (records, keys) that writes one batch -
+                records is the list of queued journal records in order, keys
+                the set of dirty file names
+            interval: Seconds to wait for more writes before committing
+            name: Thread name
+        """
+        self._commit = commit
+        self.interval = interval
+
+        self._cond = threading.Condition()
+        self._records = []
+        self._keys = set()
+        # Sequence numbers of queued and committed writes
+        self._queued = 0
+        self._committed = 0
+        self._flush_requested = False
+        self._stopping = False
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def append(self, record):
+        """Queue a journal record (kept in order, never coalesced)"""
+        with self._cond:
+            self._records.append(record)
+            self._queued += 1
+
+    def mark(self, key):
+        """Queue a rewrite of the named file; repeated marks coalesce"""
+        with self._cond:
+            self._keys.add(key)
+            self._queued += 1
+
+    def flush(self, timeout=None):
+        """Commit everything queued so far and wait for it
+
+        Args:
+            timeout: Seconds to wait, or None to wait until done
+
+        Returns:
+            True if every write queued before the call is on disk
+        """
+        with self._cond:
+            target = self._queued
+            if self._committed >= target:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._committed >= target, timeout)
+
+    def close(self, timeout=None):
+        """Flush outstanding writes and stop the thread
+
+        Returns:
+            True if everything queued was committed before stopping
+        """
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
+        return flushed
+
+    def _run(self):
+        """Writer thread: commit a batch per interval or flush request"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._flush_requested or self._stopping, self.interval)
+                if self._stopping:
+                    return
+                self._flush_requested = False
+                records, self._records = self._records, []
+                keys, self._keys = self._keys, set()
+                batch_end = self._queued
+
+            try:
+                if records or keys:
+                    self._commit(records, keys)
+            except Exception as e:
+                print(f"Error committing queued writes, will retry: {e}")
+                with self._cond:
+                    # Put the batch back in front of anything queued since
+                    self._records = records + self._records
+                    self._keys |= keys
+                continue
+
+            with self._cond:
+                self._committed = batch_end
+                self._cond.notify_all()